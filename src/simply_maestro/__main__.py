@@ -1,19 +1,21 @@
 """Main entry point for Simply Maestro."""
 
+import io
 import logging
 import sys
 from pathlib import Path
 
-from dotenv import load_dotenv
-
 from simply_maestro.mcp.server import start_mcp_server
 
 
 def main() -> None:
     """Start the Simply Maestro process."""
-    # Load environment variables from .env file
-    load_dotenv()
-    
+    # stdout is block-buffered when it is a pipe, which would hold log lines
+    # back until the buffer fills; flush each line as it is written instead.
+    # stdout may be missing or replaced, e.g. under pythonw
+    if isinstance(sys.stdout, io.TextIOWrapper):
+        sys.stdout.reconfigure(line_buffering=True)
+
     logging.basicConfig(
         level=logging.INFO,
         format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
@@ -1,5 +1,6 @@
 """File management functionality for Simply Maestro."""
 
+import codecs
 import difflib
 import json
 import logging
@@ -12,6 +13,11 @@ from typing import Dict, List, Optional, Tuple, Union, Any
 
 logger = logging.getLogger(__name__)
 
+# Default number of bytes returned by read_file_chunk
+DEFAULT_CHUNK_SIZE = 64 * 1024
+# Largest number of bytes read_file_chunk returns, whatever size is asked for
+MAX_CHUNK_SIZE = 1024 * 1024
+
 
 class FileManager:
     """Manages file operations for Simply Maestro."""
@@ -68,6 +74,67 @@ class FileManager:
             logger.error(error_msg)
             return False, error_msg
 
+    def read_file_chunk(
+        self, path: Union[str, Path], offset: int = 0, size: int = DEFAULT_CHUNK_SIZE
+    ) -> Tuple[bool, Union[Dict[str, Any], str]]:
+        """Read part of a file, so large files can be read without loading them whole.
+
+        The chunk ends on a character boundary, so consecutive chunks can be
+        concatenated to rebuild the text.
+
+        Args:
+            path: Path to the file.
+            offset: Byte offset to start reading at.
+            size: Maximum number of bytes to read, at most MAX_CHUNK_SIZE.
+
+        Returns:
+            Tuple of (success, chunk information or error message). The chunk
+            information holds the content, the offset of the next chunk, the
+            total file size, and whether the end of the file was reached.
+        """
+        path = Path(path).resolve()
+        if not self._is_path_allowed(path):
+            error_msg = f"Path not allowed: {path}"
+            logger.error(error_msg)
+            return False, error_msg
+
+        if offset < 0 or size <= 0:
+            return False, f"Invalid offset or size: offset={offset}, size={size}"
+        # A single UTF-8 character can take up to 4 bytes
+        size = min(max(size, 4), MAX_CHUNK_SIZE)
+
+        try:
+            if not path.exists():
+                return False, f"File not found: {path}"
+
+            if not path.is_file():
+                return False, f"Not a file: {path}"
+
+            with path.open("rb") as f:
+                total_size = os.fstat(f.fileno()).st_size
+                f.seek(offset)
+                data = f.read(size)
+
+            eof = offset + len(data) >= total_size
+            # Leave a character split by the end of the chunk for the next one
+            # Replace invalid bytes, so a chunk covering them can still be read
+            decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+            content = decoder.decode(data, final=eof)
+            pending = len(decoder.getstate()[0])
+            next_offset = offset + len(data) - pending
+
+            return True, {
+                "content": content,
+                "offset": offset,
+                "next_offset": next_offset,
+                "size": total_size,
+                "eof": eof,
+            }
+        except Exception as e:
+            error_msg = f"Failed to read file {path}: {str(e)}"
+            logger.error(error_msg)
+            return False, error_msg
+
     def write_file(self, path: Union[str, Path], content: str) -> Tuple[bool, str]:
         """Write content to a file.
 
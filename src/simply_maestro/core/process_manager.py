@@ -3,6 +3,7 @@
 import asyncio
 import logging
 import os
+import shlex
 import signal
 import subprocess
 import time
@@ -22,7 +23,7 @@ class ProcessConfig:
     command: Union[str, List[str]]
     working_dir: Path
     env: Optional[Dict[str, str]] = None
-    restart_delay: float = 1.0
+    restart_delay: float = 0.0  # Extra delay between stopping and starting on restart
     max_restart_attempts: int = 3
     capture_output: bool = True
     port: Optional[int] = None  # Port that the process listens on, if applicable
@@ -42,6 +43,9 @@ class ProcessManager:
         self._pid: Optional[int] = None
         self._restart_count = 0
         self._output_callback: Optional[Callable[[str], None]] = None
+        # Serializes restarts, so concurrent requests don't interleave their
+        # stop and start phases
+        self._restart_lock = asyncio.Lock()
 
     @property
     def is_running(self) -> bool:
@@ -53,11 +57,9 @@ class ProcessManager:
         if self._process is None or self._pid is None:
             return False
 
-        try:
-            process = psutil.Process(self._pid)
-            return process.is_running() and process.status() != psutil.STATUS_ZOMBIE
-        except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
-            return False
+        # The process is our own child, so poll() answers this (and reaps it
+        # once it has exited) without a psutil round-trip through /proc
+        return self._process.poll() is None
 
     def _find_process_by_port(self) -> Optional[int]:
         """Find a process that is listening on the configured port.
@@ -136,8 +138,8 @@ class ProcessManager:
             port_pids = self._get_processes_using_port(self.config.port)
             if port_pids:
                 logger.warning(f"Port {self.config.port} is in use by processes {port_pids} when attempting to start new process")
-                # Try to force kill processes using the port
-                port_cleared = await self._force_kill_port_processes()
+                # Try to force kill processes using the port, reusing the scan above
+                port_cleared = await self._force_kill_port_processes(port_pids)
                 if not port_cleared:
                     return False, f"Failed to free port {self.config.port} for new process"
                 logger.info(f"Successfully cleared port {self.config.port} for new process")
@@ -146,7 +148,11 @@ class ProcessManager:
         try:
             cmd = self.config.command
             if isinstance(cmd, str):
-                cmd = cmd.split()
+                # Run the command directly rather than through a shell. On POSIX,
+                # split it like a shell would, so quoted arguments stay whole;
+                # shlex would drop the backslashes of Windows paths, so there it
+                # is only split on whitespace.
+                cmd = shlex.split(cmd) if os.name == "posix" else cmd.split()
 
             env = os.environ.copy()
             if self.config.env:
@@ -164,9 +170,8 @@ class ProcessManager:
                 env=env,
                 stdout=stdout_dest,
                 stderr=stderr_dest,
-                text=True,
-                bufsize=1,
-                universal_newlines=True,
+                # Keep the pipe in binary mode; lines are decoded in _read_output
+                # so no TextIOWrapper/locale lookup is needed on our side
                 start_new_session=True,  # Create a new process group
             )
             self._pid = self._process.pid
@@ -209,6 +214,96 @@ class ProcessManager:
         # If we're here, the process is still running after timeout
         return False
         
+    async def _wait_for_exit(self, process: subprocess.Popen, timeout: float) -> bool:
+        """Wait for a process started by this manager to exit and reap it.
+        
+        Uses a pidfd registered with the event loop where available, so the
+        wait wakes up as soon as the process exits; otherwise polls.
+        
+        Args:
+            process: The Popen handle of the process to wait for
+            timeout: Maximum time to wait in seconds
+            
+        Returns:
+            True if the process has exited, False if it is still running
+        """
+        if process.poll() is not None:
+            return True
+            
+        loop = asyncio.get_running_loop()
+        pidfd = None
+        if hasattr(os, "pidfd_open"):
+            try:
+                pidfd = os.pidfd_open(process.pid)
+            except OSError:
+                pidfd = None
+                
+        if pidfd is not None:
+            exited = loop.create_future()
+            
+            def on_exit() -> None:
+                if not exited.done():
+                    exited.set_result(None)
+                    
+            try:
+                loop.add_reader(pidfd, on_exit)
+                try:
+                    await asyncio.wait_for(exited, timeout)
+                except asyncio.TimeoutError:
+                    pass
+                finally:
+                    loop.remove_reader(pidfd)
+                return process.poll() is not None
+            except NotImplementedError:
+                # Event loop can't watch file descriptors; fall back to polling
+                pass
+            finally:
+                os.close(pidfd)
+                
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            await asyncio.sleep(0.05)
+            if process.poll() is not None:
+                return True
+        return False
+
+    async def _terminate_owned_process(self, process: subprocess.Popen) -> None:
+        """Terminate a process started by this manager.
+        
+        The process is signalled and reaped through its Popen handle, so no
+        psutil lookups are needed.
+        
+        Args:
+            process: The Popen handle of the process to stop
+        """
+        if os.name == 'posix':
+            # The process was started with start_new_session=True, so it leads
+            # its own process group and its PID is the group ID
+            pgid = process.pid
+            try:
+                os.killpg(pgid, signal.SIGTERM)
+                if not await self._wait_for_exit(process, timeout=5.0):
+                    # Force kill the process group if timeout
+                    logger.warning("Process did not terminate gracefully, using SIGKILL")
+                    os.killpg(pgid, signal.SIGKILL)
+                    await self._wait_for_exit(process, timeout=2.0)
+                return
+            except ProcessLookupError:
+                # The process group is already gone; just reap the process
+                process.poll()
+                return
+            except PermissionError as e:
+                logger.warning(f"Error terminating process group: {str(e)}, falling back to direct termination")
+                
+        # Windows, or the process group could not be signalled
+        try:
+            process.terminate()
+            if not await self._wait_for_exit(process, timeout=5.0):
+                process.kill()
+                await self._wait_for_exit(process, timeout=2.0)
+        except ProcessLookupError:
+            process.poll()
+
     def _get_processes_using_port(self, port: int) -> List[int]:
         """Find all processes using a specific port.
         
@@ -272,19 +367,18 @@ class ProcessManager:
             # First try graceful termination
             process.terminate()
             
-            # Wait briefly for termination
-            try:
-                process.wait(timeout=2)
+            # Wait briefly for termination without blocking the event loop,
+            # so several kills can be awaited concurrently
+            if await self._verify_process_stopped(process, timeout=2.0):
                 return True
-            except psutil.TimeoutExpired:
-                # Force kill if still running
-                process.kill()
-                try:
-                    process.wait(timeout=3)
-                    return True
-                except psutil.TimeoutExpired:
-                    logger.error(f"Failed to kill process {pid} after multiple attempts")
-                    return False
+                
+            # Force kill if still running
+            process.kill()
+            if await self._verify_process_stopped(process, timeout=3.0):
+                return True
+                
+            logger.error(f"Failed to kill process {pid} after multiple attempts")
+            return False
         except psutil.NoSuchProcess:
             # Process already gone
             return True
@@ -292,9 +386,13 @@ class ProcessManager:
             logger.error(f"Error killing process {pid}: {e}")
             return False
 
-    async def _force_kill_port_processes(self) -> bool:
+    async def _force_kill_port_processes(self, pids: Optional[List[int]] = None) -> bool:
         """Force kill all processes using the configured port.
         
+        Args:
+            pids: Process IDs already known to be using the port. If None, the
+                  port is scanned to find them.
+            
         Returns:
             True if successful, False otherwise
         """
@@ -303,21 +401,20 @@ class ProcessManager:
             
         logger.warning(f"Attempting to force kill all processes using port {self.config.port}")
         
-        # Get all processes using the port
-        pids = self._get_processes_using_port(self.config.port)
+        # Get all processes using the port, unless the caller already scanned it
+        if pids is None:
+            pids = self._get_processes_using_port(self.config.port)
         
         if not pids:
             logger.info(f"No processes found using port {self.config.port}")
             return True
             
-        # Kill each process
-        kill_results = []
-        for pid in pids:
-            if pid == os.getpid():  # Skip our own process
-                continue
-                
-            result = await self._kill_process_by_pid(pid)
-            kill_results.append(result)
+        # Kill all processes in parallel (skipping our own process), so the
+        # total wait is the slowest kill rather than the sum of all of them
+        own_pid = os.getpid()
+        await asyncio.gather(
+            *(self._kill_process_by_pid(pid) for pid in pids if pid != own_pid)
+        )
             
         # Verify the port is now free
         pids_after = self._get_processes_using_port(self.config.port)
@@ -381,7 +478,7 @@ class ProcessManager:
                 
                 logger.info(f"Found untracked processes using port {self.config.port}: {pids}")
                 # Try to force kill these processes
-                port_cleared = await self._force_kill_port_processes()
+                port_cleared = await self._force_kill_port_processes(pids)
                 if port_cleared:
                     return True, f"Successfully terminated processes using port {self.config.port}"
                 else:
@@ -395,26 +492,41 @@ class ProcessManager:
             return False, "No process ID available"
 
         try:
-            process = psutil.Process(self._pid)
             was_attached = self._process is None  # True if we attached to an existing process
             
             # First try to terminate the process normally
             logger.info(f"Stopping process with PID {self._pid}")
             
-            # Terminate process group if on Unix-like system
-            if os.name == 'posix':
+            if self._process is not None:
+                # Our own child: signal and reap it directly
+                await self._terminate_owned_process(self._process)
+            elif os.name == 'posix':
+                # Attached process: we don't own it, so go through psutil
+                process = psutil.Process(self._pid)
+                
+                # Terminate the process group; signalling the group reaches the
+                # children too, so there is no need to walk the process table
                 try:
-                    # Get all child processes before terminating the parent
-                    children = process.children(recursive=True)
+                    pgid = os.getpgid(self._pid)
                     
                     # First try to terminate the process group gracefully
-                    os.killpg(os.getpgid(self._pid), signal.SIGTERM)
+                    os.killpg(pgid, signal.SIGTERM)
                     
                     # Wait for the main process to terminate
                     if not await self._verify_process_stopped(process, timeout=5.0):
                         # Force kill the process group if timeout
                         logger.warning(f"Process did not terminate gracefully, using SIGKILL")
-                        os.killpg(os.getpgid(self._pid), signal.SIGKILL)
+                        os.killpg(pgid, signal.SIGKILL)
+                except (ProcessLookupError, PermissionError) as e:
+                    logger.warning(f"Error terminating process group: {str(e)}, falling back to direct termination")
+                    # Without the group signal, children must be found and killed
+                    # individually; collect them before the parent goes away
+                    children = process.children(recursive=True)
+                    
+                    # Fall back to regular process termination
+                    process.terminate()
+                    if not await self._verify_process_stopped(process, timeout=5.0):
+                        process.kill()
                     
                     # Ensure all children are terminated
                     for child in children:
@@ -423,21 +535,18 @@ class ProcessManager:
                                 child.kill()
                         except psutil.NoSuchProcess:
                             pass
-                except (ProcessLookupError, PermissionError) as e:
-                    logger.warning(f"Error terminating process group: {str(e)}, falling back to direct termination")
-                    # Fall back to regular process termination
-                    process.terminate()
-                    if not await self._verify_process_stopped(process, timeout=5.0):
-                        process.kill()
             else:
                 # On Windows, just terminate the process normally
+                process = psutil.Process(self._pid)
                 process.terminate()
                 if not await self._verify_process_stopped(process, timeout=5.0):
                     process.kill()
                     
             # For attached processes or if a port is configured, verify the port is released
+            port_confirmed_free = False
             if was_attached or self.config.port is not None:
-                if not await self._verify_port_released(timeout=5.0):
+                port_confirmed_free = await self._verify_port_released(timeout=5.0)
+                if not port_confirmed_free:
                     logger.warning(f"Port {self.config.port} still in use after process termination")
                     # For attached processes, we might need a more aggressive approach
                     if was_attached:
@@ -455,8 +564,9 @@ class ProcessManager:
             self._process = None
             self._pid = None
             
-            # Final verification that the process has been fully terminated
-            if self.config.port is not None:
+            # Final verification that the process has been fully terminated.
+            # Only needed if the check above did not already confirm the port is free.
+            if self.config.port is not None and not port_confirmed_free:
                 # If we have a port, ensure it's been released
                 port_released = await self._verify_port_released(timeout=1.0)
                 if not port_released:
@@ -478,12 +588,21 @@ class ProcessManager:
     async def restart(self) -> Tuple[bool, str]:
         """Restart the managed process.
 
+        The process is stopped and a new one is started, without attaching
+        to an existing process. stop() only returns once the process has
+        exited, so no delay is needed in between unless one is configured.
+
         Returns:
             Tuple of (success, message).
         """
-        await self.stop()
-        await asyncio.sleep(self.config.restart_delay)
-        return await self.start(force_new_process=True)
+        async with self._restart_lock:
+            stop_success, stop_message = await self.stop()
+            if not stop_success:
+                return False, f"Failed to stop process: {stop_message}"
+
+            if self.config.restart_delay > 0:
+                await asyncio.sleep(self.config.restart_delay)
+            return await self.start(force_new_process=True)
 
     def set_output_callback(self, callback: Callable[[str], None]) -> None:
         """Set a callback to receive process output.
@@ -493,37 +612,94 @@ class ProcessManager:
         """
         self._output_callback = callback
 
+    def _handle_output_line(self, raw_line: Union[bytes, bytearray], debug_enabled: bool) -> None:
+        """Decode one line of process output and pass it to the callback.
+
+        Args:
+            raw_line: Line of output as read from the pipe.
+            debug_enabled: Whether debug logging is enabled.
+        """
+        line = raw_line.decode("utf-8", errors="replace").rstrip()
+        if debug_enabled:
+            logger.debug("Process output: %s", line)
+        
+        # Look the callback up once per line; it may be set while running
+        callback = self._output_callback
+        if callback is not None:
+            callback(line)
+
     async def _read_output(self) -> None:
         """Read and process output from the managed process."""
-        if self._process is None or self._process.stdout is None:
+        process = self._process
+        if process is None or process.stdout is None:
             return
 
-        # Run the blocking readline() calls in a separate thread to avoid blocking the event loop
-        loop = asyncio.get_event_loop()
+        loop = asyncio.get_running_loop()
+        stdout = process.stdout
         
-        def read_output_thread():
-            if self._process is None or self._process.stdout is None:
-                return
-                
-            try:
-                for line in iter(self._process.stdout.readline, ''):
-                    if not line:
-                        break
+        if os.name == 'posix':
+            # Let the event loop wake us when output is available instead of
+            # parking a thread in a blocking readline()
+            fd = stdout.fileno()
+            os.set_blocking(fd, False)
+            eof = loop.create_future()
+            pending = bytearray()  # Trailing partial line from the last read
+            
+            def drain_stdout() -> None:
+                try:
+                    data = os.read(fd, 65536)
+                except BlockingIOError:
+                    return
+                except OSError as e:
+                    logger.error("Error reading process output: %s", e)
+                    data = b""
+                    
+                # Check the level once per read rather than once per line
+                debug_enabled = logger.isEnabledFor(logging.DEBUG)
+                try:
+                    if data:
+                        pending.extend(data)
+                        end = pending.rfind(b"\n")
+                        if end < 0:
+                            return
+                        lines = pending[:end].split(b"\n")
+                        del pending[:end + 1]
+                    else:
+                        # End of output: flush any unterminated last line
+                        lines = [pending[:]] if pending else []
+                        pending.clear()
                         
-                    line = line.rstrip()
-                    logger.debug(f"Process output: {line}")
+                    for raw_line in lines:
+                        self._handle_output_line(raw_line, debug_enabled)
+                except Exception as e:
+                    logger.error("Error handling process output: %s", e)
                     
-                    if self._output_callback:
-                        self._output_callback(line)
-            except Exception as e:
-                logger.error(f"Error reading process output: {str(e)}")
-        
-        # Run in a thread pool to avoid blocking the event loop
-        await loop.run_in_executor(None, read_output_thread)
+                if not data:
+                    loop.remove_reader(fd)
+                    if not eof.done():
+                        eof.set_result(None)
+            
+            loop.add_reader(fd, drain_stdout)
+            await eof
+        else:
+            # Event loops on Windows can't watch pipes; read in a worker thread
+            def read_output_thread() -> None:
+                debug_enabled = logger.isEnabledFor(logging.DEBUG)
+                try:
+                    for raw_line in iter(stdout.readline, b''):
+                        self._handle_output_line(raw_line, debug_enabled)
+                except Exception as e:
+                    logger.error("Error reading process output: %s", e)
+                    
+            await loop.run_in_executor(None, read_output_thread)
+            
+        stdout.close()
 
-        # Check if process has exited
-        if self._process and self._process.poll() is not None:
-            exit_code = self._process.returncode
+        # Output usually ends just before the process exits, so give it a moment.
+        # Check that it wasn't replaced (e.g. by a restart) in the meantime.
+        exited = await self._wait_for_exit(process, timeout=1.0)
+        if self._process is process and exited:
+            exit_code = process.returncode
             logger.info(f"Process exited with code: {exit_code}")
             
             self._process = None
@@ -1,93 +1,775 @@
 """Version control functionality for Simply Maestro."""
 
+import asyncio
 import logging
-import subprocess
+import os
+import re
+import shutil
+import threading
+import time
 from pathlib import Path
-from typing import List, Optional, Tuple, Union
+from types import ModuleType
+from typing import Any, AsyncGenerator, Awaitable, Callable, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+pygit2: Optional[ModuleType]
+try:
+    import pygit2
+except ImportError:  # Optional: without it, `git status` always runs as a subprocess
+    pygit2 = None
+
+Observer: Optional[Any]
+try:
+    from watchdog.events import FileSystemEvent, FileSystemEventHandler
+    from watchdog.observers import Observer
+except ImportError:  # Optional: without it, status results are cached for a fixed time
+    Observer = None
 
 logger = logging.getLogger(__name__)
 
+# Paths accepted for files in the repository
+StrPath = Union[str, "os.PathLike[str]"]
+
+# Git executable, resolved once rather than searched for on PATH by every command
+_GIT_BIN = shutil.which("git") or "git"
+
+# Default limit on the output returned by commands that can produce a lot of it
+DEFAULT_MAX_OUTPUT_BYTES = 1024 * 1024
+
+# Default size of the diff returned by get_diff_preview
+DEFAULT_DIFF_PREVIEW_BYTES = 256 * 1024
+
+# Default time a git command may take before it is stopped
+DEFAULT_GIT_TIMEOUT = 30.0
+
+# Size of the reads from git's output when it is limited, and so how often
+# progress is reported
+_OUTPUT_CHUNK_SIZE = 64 * 1024
+
+# `git log` options for each supported pretty_format, and for anything else
+# (which shows relative dates)
+LOG_FORMATS = {
+    "oneline": "--oneline",
+    "short": "--pretty=short",
+    "medium": "--pretty=medium",
+    "full": "--pretty=full",
+    "fuller": "--pretty=fuller",
+}
+_DEFAULT_LOG_FORMAT = "--pretty=format:%h - %an, %ar : %s"
+
+# Bounds on the number of git commands run at once by default, which otherwise
+# follows the CPU count. git mostly waits on I/O, so even a single CPU can
+# keep a few of them busy.
+MIN_CONCURRENT_GIT_COMMANDS = 4
+MAX_CONCURRENT_GIT_COMMANDS = 8
+
+# Longest time a `git status` result is reused while the repository is watched.
+# Watchdog events arrive asynchronously, so a change can go unseen for a while.
+WATCHED_STATUS_CACHE_TTL = 5.0
+
+# Paths that `git status --porcelain` prints without C-style quoting
+_UNQUOTED_PATH = re.compile(r'[!#-\[\]-~]*')
+
+if pygit2 is not None:
+    # libgit2 status flags and the porcelain codes they map to, per column
+    _LIBGIT2_INDEX_CODES = (
+        (pygit2.GIT_STATUS_INDEX_NEW, "A"),
+        (pygit2.GIT_STATUS_INDEX_MODIFIED, "M"),
+        (pygit2.GIT_STATUS_INDEX_DELETED, "D"),
+        (pygit2.GIT_STATUS_INDEX_RENAMED, "R"),
+        (pygit2.GIT_STATUS_INDEX_TYPECHANGE, "T"),
+    )
+    _LIBGIT2_WORKTREE_CODES = (
+        (pygit2.GIT_STATUS_WT_MODIFIED, "M"),
+        (pygit2.GIT_STATUS_WT_DELETED, "D"),
+        (pygit2.GIT_STATUS_WT_TYPECHANGE, "T"),
+    )
+    # Entries git reports differently from libgit2 (conflicts, renamed
+    # work tree files) or not at all
+    _LIBGIT2_UNSUPPORTED = (
+        pygit2.GIT_STATUS_CONFLICTED
+        | pygit2.GIT_STATUS_WT_RENAMED
+        | pygit2.GIT_STATUS_WT_UNREADABLE
+    )
+    _LIBGIT2_INDEX_FLAGS = (
+        pygit2.GIT_STATUS_INDEX_NEW
+        | pygit2.GIT_STATUS_INDEX_MODIFIED
+        | pygit2.GIT_STATUS_INDEX_DELETED
+        | pygit2.GIT_STATUS_INDEX_RENAMED
+        | pygit2.GIT_STATUS_INDEX_TYPECHANGE
+    )
+    # Intent-to-add entries (`git add -N`) are staged as the empty blob, and
+    # libgit2 reports them as added rather than as added in the work tree
+    _EMPTY_BLOB_ID = str(pygit2.hash(b""))
+
+
+class _ProgressReporter:
+    """Reports how much output has been read from a Git command, from its own task.
+
+    Reporting can wait on a slow client, which must not hold up reading the
+    output, and with it the command's slot and timeout. Counts that arrive
+    while a report is being sent are combined into the next one.
+    """
+
+    def __init__(self, progress: Callable[[int], Awaitable[None]]) -> None:
+        """Start reporting.
+
+        Args:
+            progress: Coroutine function called with the number of bytes read so far.
+        """
+        self._progress = progress
+        self._count = 0
+        self._reported = 0
+        self._changed = asyncio.Event()
+        self._closing = False
+        self._task = asyncio.ensure_future(self._report())
+
+    def update(self, count: int) -> None:
+        """Record the number of bytes read so far, to be reported.
+
+        Args:
+            count: Number of bytes read so far.
+        """
+        self._count = count
+        self._changed.set()
+
+    async def _report(self) -> None:
+        """Report counts as they change, until closed."""
+        while True:
+            await self._changed.wait()
+            self._changed.clear()
+            if self._count != self._reported:
+                self._reported = self._count
+                try:
+                    await self._progress(self._count)
+                except Exception as e:
+                    # Progress is informational, so don't fail the command over it
+                    logger.warning(f"Failed to report progress: {str(e)}")
+                    return
+            # Counts that arrived during the report have set the event again
+            if self._closing and self._count == self._reported:
+                return
+
+    async def close(self) -> None:
+        """Report the last count, if it hasn't been, and stop reporting."""
+        self._closing = True
+        self._changed.set()
+        await self._task
+
+    def cancel(self) -> None:
+        """Stop reporting without waiting for the last count to be reported."""
+        self._task.cancel()
+
+
+if Observer is not None:
+
+    class _RepoChangeHandler(FileSystemEventHandler):
+        """Watchdog event handler that marks cached `git status` results stale."""
+
+        # Event types that can change what `git status` reports
+        _EVENT_TYPES = frozenset({"created", "modified", "deleted", "moved"})
+
+        def __init__(
+            self, manager: "VersionControlManager", ignored_paths: Tuple[str, ...]
+        ) -> None:
+            """Initialize the handler.
+
+            Args:
+                manager: Version control manager whose status cache to invalidate.
+                ignored_paths: Path prefixes whose changes don't affect the status.
+            """
+            super().__init__()
+            self._manager = manager
+            self._ignored_paths = ignored_paths
+
+        def dispatch(self, event: FileSystemEvent) -> None:
+            """Handle a file system event from the watchdog observer thread.
+
+            Args:
+                event: The file system event.
+            """
+            if event.event_type not in self._EVENT_TYPES:
+                return
+            if str(event.src_path).startswith(self._ignored_paths):
+                return
+            # Only this thread writes the counter; the event loop just compares it
+            self._manager._fs_generation += 1
+
 
 class VersionControlManager:
     """Manages Git operations for Simply Maestro."""
 
-    def __init__(self, repo_path: Path) -> None:
+    def __init__(
+        self,
+        repo_path: Path,
+        status_cache_ttl: float = 0.5,
+        watch: bool = True,
+        git_timeout: Optional[float] = DEFAULT_GIT_TIMEOUT,
+        max_git_commands: Optional[int] = None,
+    ) -> None:
         """Initialize the version control manager.
 
         Args:
             repo_path: Path to the Git repository.
+            status_cache_ttl: Seconds for which a `git status` result is reused
+                when the repository is not being watched for changes.
+            watch: If True and watchdog is installed, watch the repository for
+                changes and reuse `git status` results until something changes,
+                for at most WATCHED_STATUS_CACHE_TTL seconds.
+            git_timeout: Seconds after which a Git command that only reads
+                the repository is stopped and reported as failed, or None to
+                wait indefinitely. Commands that change the repository are
+                never stopped, as they may be running slow hooks.
+            max_git_commands: Number of Git commands to run at once. Defaults
+                to the CPU count, within MIN_CONCURRENT_GIT_COMMANDS and
+                MAX_CONCURRENT_GIT_COMMANDS.
         """
         self.repo_path = repo_path.resolve()
+        self._git_timeout = git_timeout
+        # Whether repo_path is inside a Git work tree, once confirmed
+        self._is_repo: Optional[bool] = None
 
-    def _run_git_command(self, args: List[str]) -> Tuple[bool, str]:
+        # Recent `git status` results keyed by arguments, as
+        # (timestamp, file system generation, result), and the status commands
+        # currently running, as (file system generation, task)
+        self._status_cache_ttl = status_cache_ttl
+        self._status_cache: Dict[Tuple[str, ...], Tuple[float, int, Tuple[bool, str]]] = {}
+        self._status_inflight: Dict[
+            Tuple[str, ...], Tuple[int, "asyncio.Future[Tuple[bool, str]]"]
+        ] = {}
+        # Bumped whenever cached results become stale, by our own changes and by
+        # changes seen by the file system watcher respectively
+        self._status_generation = 0
+        self._fs_generation = 0
+        self._observer = self._start_watcher() if watch else None
+        self._libgit2_repo = self._open_libgit2_repo()
+        # libgit2 objects must not be used from several threads at once
+        self._libgit2_lock = threading.Lock()
+
+        if max_git_commands is None:
+            max_git_commands = max(
+                MIN_CONCURRENT_GIT_COMMANDS,
+                min(os.cpu_count() or 1, MAX_CONCURRENT_GIT_COMMANDS),
+            )
+        self._git_slots = asyncio.Semaphore(max_git_commands)
+
+        # Long-lived `git cat-file --batch-check` used to look up object names
+        # without starting a process per lookup, started on first use
+        self._batch_check: Optional[asyncio.subprocess.Process] = None
+        self._batch_check_lock = asyncio.Lock()
+
+    def _open_libgit2_repo(self) -> Optional[Any]:
+        """Open the repository with libgit2, to read its status in-process.
+
+        Returns:
+            The pygit2 repository, or None if pygit2 is not installed or the
+            path is not the root of a Git work tree.
+        """
+        if pygit2 is None:
+            return None
+
+        try:
+            repo = pygit2.Repository(str(self.repo_path))
+        except (pygit2.GitError, KeyError):
+            return None
+
+        # libgit2 discovers enclosing repositories, but paths in the status
+        # output are only right when relative to repo_path
+        if repo.workdir is None or Path(repo.workdir).resolve() != self.repo_path:
+            return None
+        return repo
+
+    def _start_watcher(self) -> Optional[Any]:
+        """Start watching the repository for changes that affect its status.
+
+        Returns:
+            The running watchdog observer, or None if the repository can't be watched.
+        """
+        if Observer is None:
+            return None
+
+        git_dir = self.repo_path / ".git"
+        if not git_dir.is_dir():
+            # Only watch from the repository root, where index changes are visible
+            return None
+
+        # Object and ref churn doesn't change the work tree or the index
+        ignored_paths = (str(git_dir / "objects"), str(git_dir / "refs"))
+        observer = Observer()
+        try:
+            observer.schedule(
+                _RepoChangeHandler(self, ignored_paths), str(self.repo_path), recursive=True
+            )
+            observer.start()
+        except OSError as e:
+            logger.warning(f"Failed to watch {self.repo_path} for changes: {str(e)}")
+            return None
+
+        return observer
+
+    def close(self) -> None:
+        """Stop watching the repository for changes and stop helper processes."""
+        if self._observer is not None:
+            self._observer.stop()
+            self._observer.join()
+            self._observer = None
+        self._stop_batch_check()
+
+    async def aclose(self) -> None:
+        """Like close, but also wait for the helper processes to exit.
+
+        Use this while the event loop that started them is still running,
+        so they are reaped.
+        """
+        helper = self._batch_check
+        self.close()
+        if helper is not None:
+            await helper.wait()
+
+    def _stop_batch_check(self) -> None:
+        """Stop the `git cat-file --batch-check` helper, if it is running."""
+        if self._batch_check is not None:
+            if self._batch_check.returncode is None:
+                try:
+                    self._batch_check.kill()
+                except ProcessLookupError:
+                    pass
+            self._batch_check = None
+
+    async def _run_git_command(
+        self, args: Iterable[str], max_bytes: Optional[int] = None, write: bool = False
+    ) -> Tuple[bool, str]:
         """Run a Git command.
 
         Args:
             args: Command arguments to pass to Git.
+            max_bytes: Optional limit on the output to read. If Git produces more,
+                it is stopped and the output is truncated with a notice.
+            write: Whether the command changes the repository, in which case
+                it isn't stopped after the Git timeout.
 
         Returns:
             Tuple of (success, output or error message).
         """
-        cmd = ["git"]
-        cmd.extend(args)
+        success, output, truncated = await self._capture_git_output(args, max_bytes, write=write)
+        if truncated:
+            output += f"\n... [output truncated at {max_bytes} bytes]"
+        return success, output
+
+    async def _capture_git_output(
+        self,
+        args: Iterable[str],
+        max_bytes: Optional[int] = None,
+        progress: Optional[Callable[[int], Awaitable[None]]] = None,
+        write: bool = False,
+    ) -> Tuple[bool, str, bool]:
+        """Run a Git command and capture its output.
 
+        Args:
+            args: Command arguments to pass to Git.
+            max_bytes: Optional limit on the output to read. If Git produces more,
+                it is stopped and the output is cut off at the limit.
+            progress: Optional coroutine function called with the number of
+                bytes read so far, as the output arrives. Only used with max_bytes.
+            write: Whether the command changes the repository, in which case
+                it isn't stopped after the Git timeout.
+
+        Returns:
+            Tuple of (success, output or error message, whether the output was cut off).
+        """
+        if progress is None:
+            return await self._run_git_process(args, max_bytes, None, write)
+
+        reporter = _ProgressReporter(progress)
         try:
-            result = subprocess.run(
-                cmd,
-                cwd=self.repo_path,
-                capture_output=True,
-                text=True,
-                check=False,
-            )
+            result = await self._run_git_process(args, max_bytes, reporter.update, write)
+        except BaseException:
+            reporter.cancel()
+            raise
+        # Only wait for the client once git is done and its slot is free
+        await reporter.close()
+        return result
 
-            if result.returncode != 0:
-                error_msg = f"Git command failed: {result.stderr}"
+    async def _run_git_process(
+        self,
+        args: Iterable[str],
+        max_bytes: Optional[int],
+        on_read: Optional[Callable[[int], None]],
+        write: bool,
+    ) -> Tuple[bool, str, bool]:
+        """Run a Git command in a slot and capture its output.
+
+        Args:
+            args: Command arguments to pass to Git.
+            max_bytes: Optional limit on the output to read.
+            on_read: Optional function called with the number of bytes read
+                so far, as the output arrives. Only used with max_bytes.
+            write: Whether the command changes the repository.
+
+        Returns:
+            Tuple of (success, output or error message, whether the output was cut off).
+        """
+        # Bound concurrent git processes so bursts of requests don't fork
+        # more of them than the machine can run at once
+        async with self._git_slots:
+            process = None
+            try:
+                # Run git without blocking the event loop, so other MCP requests
+                # can be served while it executes
+                process = await asyncio.create_subprocess_exec(
+                    _GIT_BIN,
+                    *args,
+                    cwd=self.repo_path,
+                    stdout=asyncio.subprocess.PIPE,
+                    stderr=asyncio.subprocess.PIPE,
+                )
+                # A git waiting on a lock, a prompt or a hung file system would
+                # otherwise hold up the request and its slot indefinitely. Commands
+                # that write may run hooks, which can legitimately take long and
+                # would be left running, and the change half done, if git was killed.
+                timeout = None if write else self._git_timeout
+                stdout, stderr, truncated = await asyncio.wait_for(
+                    self._read_git_output(process, max_bytes, on_read), timeout
+                )
+
+                if process.returncode != 0 and not truncated:
+                    error_msg = f"Git command failed: {stderr.decode('utf-8', errors='replace')}"
+                    logger.error(error_msg)
+                    return False, error_msg, False
+
+                # Only strip line endings: leading spaces are significant in
+                # porcelain output, where they mark an empty status column
+                output = stdout.decode("utf-8", errors="replace").strip("\n")
+                return True, output, truncated
+            except asyncio.TimeoutError:
+                error_msg = f"Git command timed out after {timeout}s"
+                logger.error(error_msg)
+                return False, error_msg, False
+            except Exception as e:
+                error_msg = f"Failed to run Git command: {str(e)}"
                 logger.error(error_msg)
-                return False, error_msg
+                return False, error_msg, False
+            finally:
+                # Don't leave git running when it timed out, reading its output
+                # failed, or the caller was cancelled
+                if process is not None and process.returncode is None:
+                    await self._kill_git(process)
 
-            return True, result.stdout.strip()
-        except Exception as e:
-            error_msg = f"Failed to run Git command: {str(e)}"
-            logger.error(error_msg)
-            return False, error_msg
+    @staticmethod
+    async def _kill_git(process: asyncio.subprocess.Process) -> None:
+        """Stop a Git process, if it is still running, and wait for it to exit.
 
-    def is_git_repo(self) -> bool:
+        Args:
+            process: The Git process.
+        """
+        if process.returncode is None:
+            try:
+                process.kill()
+            except ProcessLookupError:
+                # It exited after all
+                pass
+        # wait() also waits for the output pipes to close, but they aren't read
+        # while unread output fills their buffer, so throw the rest away
+        if process.stdout is not None:
+            await process.stdout.read()
+        await process.wait()
+
+    @staticmethod
+    async def _read_git_output(
+        process: asyncio.subprocess.Process,
+        max_bytes: Optional[int],
+        on_read: Optional[Callable[[int], None]],
+    ) -> Tuple[bytes, bytes, bool]:
+        """Read the output of a Git process and wait for it to exit.
+
+        Args:
+            process: The Git process.
+            max_bytes: Optional limit on the output to read. If Git produces more,
+                it is stopped and the output is cut off at the limit.
+            on_read: Optional function called with the number of bytes read
+                so far, as the output arrives. Only used with max_bytes.
+
+        Returns:
+            Tuple of (stdout, stderr, whether stdout was cut off).
+        """
+        if max_bytes is None:
+            stdout, stderr = await process.communicate()
+            return stdout, stderr, False
+
+        assert process.stdout is not None and process.stderr is not None
+
+        stderr_task = asyncio.ensure_future(process.stderr.read())
+        try:
+            # Read one byte past the limit to tell whether there is more
+            chunks: List[bytes] = []
+            received = 0
+            while received <= max_bytes:
+                chunk = await process.stdout.read(
+                    min(_OUTPUT_CHUNK_SIZE, max_bytes + 1 - received)
+                )
+                if not chunk:
+                    break
+                chunks.append(chunk)
+                received += len(chunk)
+                if on_read is not None:
+                    on_read(min(received, max_bytes))
+            stdout = b"".join(chunks)
+            truncated = False
+            # Don't let git produce output we would only throw away
+            if len(stdout) > max_bytes:
+                truncated = True
+                stdout = stdout[:max_bytes]
+                await VersionControlManager._kill_git(process)
+            stderr = await stderr_task
+            await process.wait()
+        finally:
+            stderr_task.cancel()
+        return stdout, stderr, truncated
+
+    async def is_git_repo(self) -> bool:
         """Check if the path is a Git repository.
 
         Returns:
             True if the path is a Git repository, False otherwise.
         """
-        success, _ = self._run_git_command(["rev-parse", "--is-inside-work-tree"])
+        if self._is_repo:
+            return True
+
+        success, _ = await self._run_git_command(["rev-parse", "--is-inside-work-tree"])
+        # The repository path never changes, so a positive answer holds for the
+        # lifetime of this manager. A negative one is rechecked, in case the
+        # repository is initialised later.
+        if success:
+            self._is_repo = True
         return success
 
-    def commit(
-        self, message: str, files: Optional[List[Union[str, Path]]] = None
+    async def resolve_ref(self, ref: str) -> Optional[Tuple[str, str]]:
+        """Look up the object a revision name refers to.
+
+        Lookups are answered by a single `git cat-file --batch-check` process
+        that is kept running between calls.
+
+        Args:
+            ref: Revision name, such as a branch, tag, or commit hash.
+
+        Returns:
+            Tuple of (object id, object type), or None if the name doesn't
+            refer to an object.
+        """
+        # The helper reads one name per line
+        if not ref or "\n" in ref or not await self.is_git_repo():
+            return None
+
+        async with self._batch_check_lock:
+            if self._batch_check is None or self._batch_check.returncode is not None:
+                try:
+                    self._batch_check = await asyncio.create_subprocess_exec(
+                        _GIT_BIN,
+                        "cat-file",
+                        "--batch-check",
+                        cwd=self.repo_path,
+                        stdin=asyncio.subprocess.PIPE,
+                        stdout=asyncio.subprocess.PIPE,
+                        stderr=asyncio.subprocess.DEVNULL,
+                    )
+                except OSError as e:
+                    logger.error(f"Failed to start git cat-file: {str(e)}")
+                    self._batch_check = None
+                    return None
+
+            process = self._batch_check
+            assert process.stdin is not None and process.stdout is not None
+            try:
+                process.stdin.write(ref.encode("utf-8") + b"\n")
+                await process.stdin.drain()
+                reply = await asyncio.wait_for(process.stdout.readline(), self._git_timeout)
+            except asyncio.TimeoutError:
+                logger.warning(f"git cat-file did not answer within {self._git_timeout}s")
+                self._stop_batch_check()
+                return None
+            except BaseException:
+                # An interrupted lookup would leave its reply to be read by the
+                # next one, so start over with a fresh process
+                self._stop_batch_check()
+                raise
+
+        if not reply:
+            logger.warning("git cat-file exited unexpectedly")
+            self._stop_batch_check()
+            return None
+
+        # Found objects are reported as "<id> <type> <size>", anything else as
+        # "<name> missing" or "<name> ambiguous"
+        fields = reply.decode("utf-8", errors="replace").rstrip("\n").rsplit(" ", 2)
+        if len(fields) != 3 or not fields[2].isdigit():
+            return None
+        return fields[0], fields[1]
+
+    async def get_refs_state(self) -> Optional[Tuple[Any, ...]]:
+        """Get a snapshot of HEAD and the refs, to tell when either has changed.
+
+        The snapshot is the commit HEAD points to and the modification times
+        of the files and directories Git updates when a ref is created,
+        updated, or deleted. It is much cheaper to take than running commands
+        that read the refs.
+
+        Returns:
+            Value that compares unequal once HEAD or any ref has changed, or
+            None if it can't be determined.
+        """
+        git_dir = self.repo_path / ".git"
+        if not git_dir.is_dir():
+            return None
+
+        try:
+            head_mtime = os.stat(git_dir / "HEAD").st_mtime_ns
+            try:
+                packed_refs_mtime: Optional[int] = os.stat(git_dir / "packed-refs").st_mtime_ns
+            except FileNotFoundError:
+                packed_refs_mtime = None
+            # Loose refs are replaced by renaming a lock file over them, which
+            # updates the modification time of the directory holding them
+            refs_mtimes = tuple(
+                os.stat(dirpath).st_mtime_ns for dirpath, _, _ in os.walk(git_dir / "refs")
+            )
+        except OSError:
+            return None
+
+        return await self.resolve_ref("HEAD"), head_mtime, packed_refs_mtime, refs_mtimes
+
+    async def _run_repo_command(
+        self, args: Iterable[str], max_bytes: Optional[int] = None
+    ) -> Tuple[bool, str]:
+        """Run a Git command that requires the path to be a Git repository.
+
+        The repository check and the command are independent, so both
+        subprocesses are run concurrently rather than one after the other.
+
+        Args:
+            args: Command arguments to pass to Git.
+            max_bytes: Optional limit on the output to read.
+
+        Returns:
+            Tuple of (success, output or error message).
+        """
+        is_repo, (success, result) = await asyncio.gather(
+            self.is_git_repo(), self._run_git_command(args, max_bytes)
+        )
+        if not is_repo:
+            return False, f"Not a Git repository: {self.repo_path}"
+
+        return success, result
+
+    async def _get_cached_status(
+        self,
+        args: Tuple[str, ...],
+        compute: Optional[Callable[[], Awaitable[Tuple[bool, str]]]] = None,
+    ) -> Tuple[bool, str]:
+        """Run a `git status` command, reusing recent and in-flight results.
+
+        Args:
+            args: Command arguments to pass to Git.
+            compute: Optional coroutine function producing the same output as
+                the command, used instead of running it.
+
+        Returns:
+            Tuple of (success, output or error message).
+        """
+        fs_generation = self._fs_generation
+        cached = self._status_cache.get(args)
+        if cached is not None and cached[1] == fs_generation:
+            # While watching, results stay valid until a change is seen, but only
+            # for a bounded time in case the event for a change is late or lost
+            ttl = WATCHED_STATUS_CACHE_TTL if self._observer is not None else self._status_cache_ttl
+            if time.monotonic() - cached[0] < ttl:
+                return cached[2]
+
+        # Join an identical command that is already running instead of forking again
+        inflight = self._status_inflight.get(args)
+        if inflight is not None and inflight[0] == fs_generation:
+            task = inflight[1]
+        else:
+            started = time.monotonic()
+            generation = self._status_generation
+            # Don't let git refresh the index: that would write to the watched
+            # repository (invalidating the result) and contend for index.lock
+            if compute is None:
+                task = asyncio.ensure_future(
+                    self._run_repo_command(("--no-optional-locks", *args))
+                )
+            else:
+                task = asyncio.ensure_future(compute())
+            self._status_inflight[args] = (fs_generation, task)
+
+            def store_result(done: "asyncio.Future[Tuple[bool, str]]") -> None:
+                inflight = self._status_inflight.get(args)
+                if inflight is not None and inflight[1] is done:
+                    del self._status_inflight[args]
+                if done.cancelled() or done.exception() is not None:
+                    return
+                result = done.result()
+                # Don't cache a result our own changes made stale; changes seen by
+                # the watcher are caught by comparing the file system generation
+                if result[0] and generation == self._status_generation:
+                    self._status_cache[args] = (started, fs_generation, result)
+
+            task.add_done_callback(store_result)
+
+        # Shield the shared task so one cancelled caller doesn't cancel the others
+        return await asyncio.shield(task)
+
+    @property
+    def status_generation(self) -> int:
+        """Counter that changes whenever cached `git status` results are discarded."""
+        return self._status_generation
+
+    def invalidate_status_cache(self) -> None:
+        """Discard cached `git status` results after the repository changed.
+
+        Call this after changing files in the work tree other than through
+        this manager, so the next status reflects the change.
+        """
+        self._status_generation += 1
+        self._status_cache.clear()
+        self._status_inflight.clear()
+
+    async def commit(
+        self, message: str, files: Optional[Sequence[StrPath]] = None
     ) -> Tuple[bool, str]:
         """Commit changes to the repository.
 
         Args:
             message: Commit message.
-            files: Optional list of files to commit. If None, commits all changes.
+            files: Optional list of files to commit, leaving other changes
+                uncommitted. If None, commits all changes.
 
         Returns:
             Tuple of (success, message).
         """
-        if not self.is_git_repo():
+        if files:
+            paths = tuple(os.fspath(f) for f in files)
+            add_cmd: Tuple[str, ...] = ("add", "--", *paths)
+            # Once added, new files are known to git, so `--only` can commit
+            # just these paths and leave anything else staged as it is
+            commit_cmd: Tuple[str, ...] = ("commit", "--only", "-m", message, "--", *paths)
+        else:
+            add_cmd = ("add", "--all")
+            commit_cmd = ("commit", "-m", message)
+
+        # Add files to staging area while checking for a repository
+        is_repo, (success, result) = await asyncio.gather(
+            self.is_git_repo(), self._run_git_command(add_cmd, write=True)
+        )
+        if not is_repo:
             return False, f"Not a Git repository: {self.repo_path}"
+        self.invalidate_status_cache()
 
         try:
-            # Add files to staging area
-            if files:
-                file_paths = [str(f) for f in files]
-                success, result = self._run_git_command(["add", "--"] + file_paths)
-            else:
-                success, result = self._run_git_command(["add", "--all"])
-
             if not success:
                 return False, f"Failed to stage files: {result}"
 
             # Commit changes
-            success, result = self._run_git_command(["commit", "-m", message])
+            success, result = await self._run_git_command(commit_cmd, write=True)
+            self.invalidate_status_cache()
             if not success:
                 # If there's nothing to commit, that's still considered a success
                 if "nothing to commit" in result:
@@ -100,8 +782,8 @@ class VersionControlManager:
             logger.error(error_msg)
             return False, error_msg
 
-    def stage_files(
-        self, files: List[Union[str, Path]]
+    async def stage_files(
+        self, files: Sequence[StrPath]
     ) -> Tuple[bool, str]:
         """Add files to the staging area.
 
@@ -111,12 +793,14 @@ class VersionControlManager:
         Returns:
             Tuple of (success, message).
         """
-        if not self.is_git_repo():
+        if not await self.is_git_repo():
             return False, f"Not a Git repository: {self.repo_path}"
 
         try:
-            file_paths = [str(f) for f in files]
-            success, result = self._run_git_command(["add", "--"] + file_paths)
+            success, result = await self._run_git_command(
+                ("add", "--", *(os.fspath(f) for f in files)), write=True
+            )
+            self.invalidate_status_cache()
             
             if not success:
                 return False, f"Failed to add files to staging area: {result}"
@@ -127,8 +811,8 @@ class VersionControlManager:
             logger.error(error_msg)
             return False, error_msg
             
-    def restore(
-        self, files: List[Union[str, Path]], staged: bool = False
+    async def restore(
+        self, files: Sequence[StrPath], staged: bool = False
     ) -> Tuple[bool, str]:
         """Restore files to their state in the last commit.
 
@@ -139,19 +823,15 @@ class VersionControlManager:
         Returns:
             Tuple of (success, message).
         """
-        if not self.is_git_repo():
+        if not await self.is_git_repo():
             return False, f"Not a Git repository: {self.repo_path}"
 
         try:
-            file_paths = [str(f) for f in files]
-            cmd = ["restore"]
-            
-            if staged:
-                cmd.append("--staged")
-                
-            cmd.extend(["--"] + file_paths)
-            
-            success, result = self._run_git_command(cmd)
+            cmd = ("restore", "--staged") if staged else ("restore",)
+            success, result = await self._run_git_command(
+                (*cmd, "--", *(os.fspath(f) for f in files)), write=True
+            )
+            self.invalidate_status_cache()
             if not success:
                 return False, f"Failed to restore files: {result}"
 
@@ -161,30 +841,117 @@ class VersionControlManager:
             logger.error(error_msg)
             return False, error_msg
 
-    def get_status(self) -> Tuple[bool, str]:
+    async def get_status(self) -> Tuple[bool, str]:
         """Get the status of the repository.
 
         Returns:
             Tuple of (success, status).
         """
-        if not self.is_git_repo():
-            return False, f"Not a Git repository: {self.repo_path}"
+        if self._libgit2_repo is not None:
+            return await self._get_cached_status(
+                ("status", "--porcelain"), self._get_libgit2_status
+            )
+        return await self._get_cached_status(("status", "--porcelain"))
+
+    async def _get_libgit2_status(self) -> Tuple[bool, str]:
+        """Get the porcelain status in-process, falling back to running Git.
+
+        Returns:
+            Tuple of (success, status).
+        """
+        assert pygit2 is not None
+        try:
+            # libgit2 scans the work tree synchronously, so keep it off the event loop
+            status = await asyncio.to_thread(self._format_libgit2_status)
+        except pygit2.GitError as e:
+            logger.warning(f"Failed to read status with libgit2: {str(e)}")
+            status = None
+
+        if status is None:
+            return await self._run_repo_command(("--no-optional-locks", "status", "--porcelain"))
+        return True, status
+
+    def _format_libgit2_status(self) -> Optional[str]:
+        """Read the status with libgit2 and format it like `git status --porcelain`.
+
+        Returns:
+            The formatted status, or None if it contains entries that libgit2
+            can't report exactly as Git would (renames, conflicts, quoted paths,
+            paths both in the index and untracked, intent-to-add entries).
+        """
+        # Only called once the repository has been opened with libgit2
+        assert pygit2 is not None and self._libgit2_repo is not None
+        with self._libgit2_lock:
+            entries = self._libgit2_repo.status(untracked_files="normal")
+            if any(flags & pygit2.GIT_STATUS_INDEX_NEW for flags in entries.values()):
+                index = self._libgit2_repo.index
+                index.read(False)
+                for path, flags in entries.items():
+                    # A staged empty file looks the same, and is left to Git too
+                    if (
+                        flags & pygit2.GIT_STATUS_INDEX_NEW
+                        and str(index[path].id) == _EMPTY_BLOB_ID
+                    ):
+                        return None
+
+        changed: List[Tuple[str, str]] = []
+        untracked: List[Tuple[str, str]] = []
+        added = deleted = False
+        for path, flags in entries.items():
+            if flags & _LIBGIT2_UNSUPPORTED or not _UNQUOTED_PATH.fullmatch(path):
+                return None
+            if flags & pygit2.GIT_STATUS_WT_NEW:
+                if flags & _LIBGIT2_INDEX_FLAGS:
+                    # Removed from the index but still present, which Git
+                    # reports on two lines
+                    return None
+                untracked.append((path, f"?? {path}"))
+                continue
+
+            index_code = next((code for flag, code in _LIBGIT2_INDEX_CODES if flags & flag), " ")
+            worktree_code = next(
+                (code for flag, code in _LIBGIT2_WORKTREE_CODES if flags & flag), " "
+            )
+            if index_code == worktree_code == " ":
+                # Ignored files, or entries that only differ in stat information
+                continue
+            added = added or index_code == "A"
+            deleted = deleted or index_code == "D"
+            changed.append((path, f"{index_code}{worktree_code} {path}"))
 
-        return self._run_git_command(["status", "--porcelain"])
+        if added and deleted:
+            # Git pairs these up into renames, which libgit2 doesn't detect here
+            return None
+
+        # Git lists tracked changes before untracked files, each sorted by path
+        changed.sort()
+        untracked.sort()
+        return "\n".join(line for _, line in changed + untracked)
         
-    def get_detailed_status(self) -> Tuple[bool, str]:
+    async def get_combined_status(self) -> Tuple[bool, str]:
+        """Get the status of the repository along with its branch information.
+
+        The output is that of `git status --porcelain --branch`: a `## ` branch
+        header line followed by the same lines as get_status, so both can be
+        read from a single command. Unlike get_status, this always runs git,
+        as libgit2 doesn't report the branch and its upstream the same way.
+
+        Returns:
+            Tuple of (success, status).
+        """
+        return await self._get_cached_status(("status", "--porcelain", "--branch"))
+
+    async def get_detailed_status(self) -> Tuple[bool, str]:
         """Get a detailed human-readable status of the repository.
 
         Returns:
             Tuple of (success, detailed status).
         """
-        if not self.is_git_repo():
-            return False, f"Not a Git repository: {self.repo_path}"
-
-        return self._run_git_command(["status"])
+        return await self._get_cached_status(("status",))
         
-    def get_log(self, count: int = 10, all_branches: bool = False, 
-                pretty_format: str = "oneline") -> Tuple[bool, str]:
+    async def get_log(self, count: int = 10, all_branches: bool = False, 
+                pretty_format: str = "oneline",
+                max_bytes: Optional[int] = DEFAULT_MAX_OUTPUT_BYTES) -> Tuple[bool, str]:
         """Get the commit history of the repository.
 
         Args:
@@ -192,26 +959,97 @@ class VersionControlManager:
             all_branches: If True, shows commits from all branches (default: False).
             pretty_format: Format of the log output (default: "oneline").
                 Options: "oneline", "short", "medium", "full", "fuller"
+            max_bytes: Maximum size of the output; longer output is truncated
+                (default: 1 MiB). None for no limit.
 
         Returns:
             Tuple of (success, log output).
         """
-        if not self.is_git_repo():
-            return False, f"Not a Git repository: {self.repo_path}"
+        return await self._run_repo_command(
+            self._log_command(count, all_branches, pretty_format), max_bytes
+        )
+
+    def _log_command(self, count: int, all_branches: bool, pretty_format: str) -> List[str]:
+        """Build the arguments of a `git log` command.
+
+        Args:
+            count: Number of commits to retrieve.
+            all_branches: If True, shows commits from all branches.
+            pretty_format: Format of the log output.
+
+        Returns:
+            Command arguments to pass to Git.
+        """
+        # Limit the walk in git itself, so only the requested commits are visited
+        cmd = ["log", LOG_FORMATS.get(pretty_format, _DEFAULT_LOG_FORMAT), f"--max-count={count}"]
 
-        cmd = ["log", f"--pretty=format:%h - %an, %ar : %s", f"-{count}"]
-        
-        if pretty_format == "oneline":
-            cmd = ["log", "--oneline", f"-{count}"]
-        elif pretty_format in ["short", "medium", "full", "fuller"]:
-            cmd = ["log", f"--pretty={pretty_format}", f"-{count}"]
-            
         if all_branches:
             cmd.append("--all")
-            
-        return self._run_git_command(cmd)
+
+        return cmd
+
+    async def iter_log(
+        self, count: int = 10, all_branches: bool = False, pretty_format: str = "oneline"
+    ) -> AsyncGenerator[str, None]:
+        """Iterate over the lines of the commit history as Git produces them.
+
+        Stopping the iteration early stops Git once the iterator is closed,
+        so close it explicitly, for example with contextlib.aclosing.
+
+        Args:
+            count: Number of commits to retrieve (default: 10).
+            all_branches: If True, shows commits from all branches (default: False).
+            pretty_format: Format of the log output (default: "oneline").
+                Options: "oneline", "short", "medium", "full", "fuller"
+
+        Yields:
+            Lines of the log output, without line endings.
+
+        Raises:
+            RuntimeError: If the path is not a Git repository, Git fails, or
+                Git produces no output for longer than the Git timeout.
+        """
+        if not await self.is_git_repo():
+            raise RuntimeError(f"Not a Git repository: {self.repo_path}")
+
+        # Only hold a slot while starting git and reading from it. While the
+        # caller handles a line, git at most waits on its full output pipe, and
+        # a slow caller must not hold up every other git command.
+        async with self._git_slots:
+            process = await asyncio.create_subprocess_exec(
+                _GIT_BIN,
+                *self._log_command(count, all_branches, pretty_format),
+                cwd=self.repo_path,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+            )
+        assert process.stdout is not None and process.stderr is not None
+        stderr_task = asyncio.ensure_future(process.stderr.read())
+        try:
+            while True:
+                async with self._git_slots:
+                    try:
+                        line = await asyncio.wait_for(process.stdout.readline(), self._git_timeout)
+                    except asyncio.TimeoutError:
+                        raise RuntimeError(
+                            f"Git command timed out after {self._git_timeout}s"
+                        ) from None
+                if not line:
+                    break
+                yield line.decode("utf-8", errors="replace").rstrip("\n")
+            stderr = await stderr_task
+            await process.wait()
+        finally:
+            # The caller may have stopped early or been cancelled
+            await self._kill_git(process)
+            stderr_task.cancel()
+
+        if process.returncode != 0:
+            error_msg = f"Git command failed: {stderr.decode('utf-8', errors='replace')}"
+            logger.error(error_msg)
+            raise RuntimeError(error_msg)
         
-    def get_show(self, commit_hash: str = "HEAD") -> Tuple[bool, str]:
+    async def get_show(self, commit_hash: str = "HEAD") -> Tuple[bool, str]:
         """Show details of a specific commit.
 
         Args:
@@ -220,36 +1058,75 @@ class VersionControlManager:
         Returns:
             Tuple of (success, commit details).
         """
-        if not self.is_git_repo():
-            return False, f"Not a Git repository: {self.repo_path}"
+        # Revision notations such as HEAD^! aren't object names, so let git
+        # show resolve the argument, but never read it as an option
+        if commit_hash.startswith("-"):
+            return False, f"Invalid revision: {commit_hash}"
 
-        return self._run_git_command(["show", commit_hash])
+        return await self._run_repo_command(["show", commit_hash])
         
-    def get_diff(self, file_path: Optional[Union[str, Path]] = None, 
-                staged: bool = False) -> Tuple[bool, str]:
+    async def get_diff(self, file_path: Optional[StrPath] = None, 
+                staged: bool = False,
+                max_bytes: Optional[int] = DEFAULT_MAX_OUTPUT_BYTES) -> Tuple[bool, str]:
         """Get the diff of files in the repository.
 
         Args:
             file_path: Optional path to a specific file.
             staged: If True, shows diff for staged changes (default: False).
+            max_bytes: Maximum size of the output; longer output is truncated
+                (default: 1 MiB). None for no limit.
 
         Returns:
             Tuple of (success, diff output).
         """
-        if not self.is_git_repo():
-            return False, f"Not a Git repository: {self.repo_path}"
-
         cmd = ["diff"]
         
         if staged:
             cmd.append("--staged")
             
         if file_path:
-            cmd.extend(["--", str(file_path)])
+            cmd.extend(("--", os.fspath(file_path)))
             
-        return self._run_git_command(cmd)
+        return await self._run_repo_command(cmd, max_bytes)
         
-    def get_branch_list(self, all_branches: bool = False) -> Tuple[bool, str]:
+    async def get_diff_preview(self, file_path: Optional[StrPath] = None,
+                staged: bool = False,
+                max_bytes: int = DEFAULT_DIFF_PREVIEW_BYTES,
+                progress: Optional[Callable[[int], Awaitable[None]]] = None
+                ) -> Tuple[bool, str, bool]:
+        """Get the beginning of the diff of files in the repository.
+
+        Args:
+            file_path: Optional path to a specific file.
+            staged: If True, shows diff for staged changes (default: False).
+            max_bytes: Maximum size of the preview (default: 256 KiB). Git is
+                stopped once it has produced this much.
+            progress: Optional coroutine function called with the number of
+                bytes read so far, as the diff arrives.
+
+        Returns:
+            Tuple of (success, diff preview or error message, whether the diff
+            was cut short). A cut short preview ends at a complete line.
+        """
+        cmd = ["diff"]
+
+        if staged:
+            cmd.append("--staged")
+
+        if file_path:
+            cmd.extend(("--", os.fspath(file_path)))
+
+        is_repo, (success, diff, truncated) = await asyncio.gather(
+            self.is_git_repo(), self._capture_git_output(cmd, max_bytes, progress)
+        )
+        if not is_repo:
+            return False, f"Not a Git repository: {self.repo_path}", False
+
+        if truncated:
+            diff = diff[: diff.rfind("\n") + 1]
+        return success, diff, truncated
+
+    async def get_branch_list(self, all_branches: bool = False) -> Tuple[bool, str]:
         """Get the list of branches in the repository.
 
         Args:
@@ -258,17 +1135,14 @@ class VersionControlManager:
         Returns:
             Tuple of (success, branch list).
         """
-        if not self.is_git_repo():
-            return False, f"Not a Git repository: {self.repo_path}"
-
         cmd = ["branch"]
         
         if all_branches:
             cmd.append("--all")
             
-        return self._run_git_command(cmd)
+        return await self._run_repo_command(cmd)
             
-    def create_tag(self, tag_name: str, message: Optional[str] = None, 
+    async def create_tag(self, tag_name: str, message: Optional[str] = None, 
                   annotated: bool = True, force: bool = False) -> Tuple[bool, str]:
         """Create a tag in the repository.
 
@@ -281,7 +1155,7 @@ class VersionControlManager:
         Returns:
             Tuple of (success, message).
         """
-        if not self.is_git_repo():
+        if not await self.is_git_repo():
             return False, f"Not a Git repository: {self.repo_path}"
 
         try:
@@ -297,7 +1171,7 @@ class VersionControlManager:
             else:
                 cmd.append(tag_name)
                 
-            success, result = self._run_git_command(cmd)
+            success, result = await self._run_git_command(cmd, write=True)
             if not success:
                 return False, f"Failed to create tag: {result}"
                 
@@ -307,13 +1181,10 @@ class VersionControlManager:
             logger.error(error_msg)
             return False, error_msg
             
-    def list_tags(self) -> Tuple[bool, str]:
+    async def list_tags(self) -> Tuple[bool, str]:
         """List all tags in the repository.
 
         Returns:
             Tuple of (success, tags list).
         """
-        if not self.is_git_repo():
-            return False, f"Not a Git repository: {self.repo_path}"
-            
-        return self._run_git_command(["tag", "-l"])
+        return await self._run_repo_command(["tag", "-l"])
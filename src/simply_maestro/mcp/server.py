@@ -1,10 +1,10 @@
 """MCP server implementation for Simply Maestro."""
 
+import asyncio
 import logging
 import os
 from pathlib import Path
 
-from dotenv import load_dotenv
 from mcp.server import FastMCP
 
 from simply_maestro.core import FileManager, VersionControlManager
@@ -41,7 +41,8 @@ def create_mcp_server(
 
     # Register all services
     register_process_services(mcp, process_manager)
-    register_file_services(mcp, file_manager)
+    # File writes change what `git status` reports
+    register_file_services(mcp, file_manager, version_control_manager)
     register_git_services(mcp, version_control_manager)
 
     return mcp
@@ -49,6 +50,9 @@ def create_mcp_server(
 
 def start_mcp_server() -> None:
     """Start the MCP server with configuration from environment variables."""
+    # Only needed when actually starting the server, not when importing it
+    from dotenv import load_dotenv
+
     # Load environment variables from .env file
     load_dotenv()
     
@@ -111,7 +115,17 @@ def start_mcp_server() -> None:
     
     # Run server with Streamable HTTP transport
     logger.info(f"Starting MCP server with Streamable HTTP on port {mcp_port}")
-    mcp_server.run(transport="http", host="0.0.0.0", port=mcp_port)
+    mcp_server.settings.host = "0.0.0.0"
+    mcp_server.settings.port = mcp_port
+
+    async def serve() -> None:
+        try:
+            await mcp_server.run_streamable_http_async()
+        finally:
+            # Git helper processes can only be reaped by the loop that started them
+            await version_control_manager.aclose()
+
+    asyncio.run(serve())
 
 if __name__ == "__main__":
     start_mcp_server()
@@ -1,10 +1,16 @@
 """MCP service implementations for Simply Maestro."""
 
-from simply_maestro.mcp.services.file_services import register_file_services
-from simply_maestro.mcp.services.git_services import register_git_services
-from simply_maestro.mcp.services.process_services import register_process_services
+from simply_maestro.mcp.services.file_services import FileServices, register_file_services
+from simply_maestro.mcp.services.git_services import GitServices, register_git_services
+from simply_maestro.mcp.services.process_services import (
+    ProcessServices,
+    register_process_services,
+)
 
 __all__ = [
+    "FileServices",
+    "GitServices",
+    "ProcessServices",
     "register_file_services",
     "register_git_services",
     "register_process_services",
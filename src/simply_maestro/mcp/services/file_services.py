@@ -1,27 +1,77 @@
 """MCP services for file operations."""
 
+import asyncio
 import logging
+from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Optional, Any, Union
 
 from mcp.server import FastMCP
 
-from simply_maestro.core import FileManager
+from simply_maestro.core import FileManager, VersionControlManager
+from simply_maestro.core.file_manager import DEFAULT_CHUNK_SIZE
 
 logger = logging.getLogger(__name__)
 
 
-def register_file_services(mcp: FastMCP, file_manager: FileManager) -> None:
-    """Register file operation MCP services.
+def _preview(text: str, length: int) -> str:
+    """Shorten text for logging.
 
     Args:
-        mcp: MCP server instance.
-        file_manager: File manager instance.
+        text: Text to shorten.
+        length: Maximum number of characters to keep.
+
+    Returns:
+        The text, truncated with an ellipsis if longer than length.
     """
-    logger.info("Registering file management MCP services")
-    
-    @mcp.tool()
-    async def read_file(path: str) -> str:
+    return text[:length] + "..." if len(text) > length else text
+
+
+class FileServices:
+    """File operation MCP tools for Simply Maestro."""
+
+    # Methods registered as MCP tools
+    TOOLS = (
+        "read_file",
+        "read_file_chunk",
+        "write_file",
+        "change_in_file",
+        "list_files",
+        "find_files",
+        "grep_files",
+    )
+
+    def __init__(
+        self,
+        file_manager: FileManager,
+        version_control_manager: Optional[VersionControlManager] = None,
+    ) -> None:
+        """Initialize the services.
+
+        Args:
+            file_manager: File manager instance.
+            version_control_manager: Optional version control manager whose
+                cached `git status` results are discarded when a file is written.
+        """
+        self._file_manager = file_manager
+        self._version_control_manager = version_control_manager
+
+    def register(self, mcp: FastMCP) -> None:
+        """Register the tools with an MCP server.
+
+        Args:
+            mcp: MCP server instance.
+        """
+        for name in self.TOOLS:
+            mcp.tool()(getattr(self, name))
+
+    def _files_changed(self) -> None:
+        """Make the next `git status` see files written by a tool."""
+        # Even a failed write may have changed the file
+        if self._version_control_manager is not None:
+            self._version_control_manager.invalidate_status_cache()
+
+    async def read_file(self, path: str) -> str:
         """Read the contents of a file.
         
         Args:
@@ -30,18 +80,50 @@ def register_file_services(mcp: FastMCP, file_manager: FileManager) -> None:
         Returns:
             The content of the file, or an error message.
         """
-        logger.info(f"MCP Tool Call: read_file(path='{path}')")
-        success, content = file_manager.read_file(path)
+        logger.info("MCP Tool Call: read_file(path='%s')", path)
+        # File manager calls do blocking disk I/O, so run them in a worker
+        # thread to keep the event loop free for other requests
+        success, content = await asyncio.to_thread(self._file_manager.read_file, path)
         if not success:
-            logger.error(f"MCP Tool read_file FAILED: {content}")
+            logger.error("MCP Tool read_file FAILED: %s", content)
             return f"Error: {content}"
         
-        content_preview = content[:100] + "..." if len(content) > 100 else content
-        logger.info(f"MCP Tool read_file SUCCESS: Read {len(content)} bytes from '{path}', preview: {content_preview}")
+        # Only build the preview when it will be logged
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "MCP Tool read_file SUCCESS: Read %d bytes from '%s', preview: %s",
+                len(content), path, _preview(content, 100),
+            )
         return content
 
-    @mcp.tool()
-    async def write_file(path: str, content: str) -> str:
+    async def read_file_chunk(
+        self, path: str, offset: int = 0, size: int = DEFAULT_CHUNK_SIZE
+    ) -> Dict[str, Any]:
+        """Read part of a file, for files too large to read in one call.
+
+        Args:
+            path: Path to the file to read.
+            offset: Byte offset to start reading at (default: 0).
+            size: Maximum number of bytes to read (default: 65536, at most
+                1048576).
+
+        Returns:
+            Dictionary containing the content, the offset to read the next
+            chunk from, the file size, and whether the end was reached.
+        """
+        logger.info("MCP Tool Call: read_file_chunk(path='%s', offset=%d, size=%d)", path, offset, size)
+        success, chunk = await asyncio.to_thread(self._file_manager.read_file_chunk, path, offset, size)
+        if not success or isinstance(chunk, str):
+            logger.error("MCP Tool read_file_chunk FAILED: %s", chunk)
+            return {"success": False, "message": f"Error: {chunk}"}
+
+        logger.info(
+            "MCP Tool read_file_chunk SUCCESS: Read bytes %d-%d of %d from '%s'",
+            offset, chunk["next_offset"], chunk["size"], path,
+        )
+        return {"success": True, "path": path, **chunk}
+
+    async def write_file(self, path: str, content: str) -> str:
         """Write content to a file.
         
         Args:
@@ -51,19 +133,21 @@ def register_file_services(mcp: FastMCP, file_manager: FileManager) -> None:
         Returns:
             A message indicating success or failure.
         """
-        content_preview = content[:100] + "..." if len(content) > 100 else content
-        logger.info(f"MCP Tool Call: edit_file(path='{path}', content='{content_preview}')")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "MCP Tool Call: edit_file(path='%s', content='%s')", path, _preview(content, 100)
+            )
         
-        success, message = file_manager.write_file(path, content)
+        success, message = await asyncio.to_thread(self._file_manager.write_file, path, content)
+        self._files_changed()
         if not success:
-            logger.error(f"MCP Tool edit_file FAILED: {message}")
+            logger.error("MCP Tool edit_file FAILED: %s", message)
             return f"Error: {message}"
         
-        logger.info(f"MCP Tool edit_file SUCCESS: {message}")
+        logger.info("MCP Tool edit_file SUCCESS: %s", message)
         return message
 
-    @mcp.tool()
-    async def change_in_file(path: str, original: str, modified: str) -> str:
+    async def change_in_file(self, path: str, original: str, modified: str) -> str:
         """Apply changes to a file using diff comparison.
         
         Args:
@@ -74,20 +158,24 @@ def register_file_services(mcp: FastMCP, file_manager: FileManager) -> None:
         Returns:
             A message indicating success or failure.
         """
-        original_preview = original[:50] + "..." if len(original) > 50 else original
-        modified_preview = modified[:50] + "..." if len(modified) > 50 else modified
-        logger.info(f"MCP Tool Call: change_in_file(path='{path}', original='{original_preview}', modified='{modified_preview}')")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "MCP Tool Call: change_in_file(path='%s', original='%s', modified='%s')",
+                path, _preview(original, 50), _preview(modified, 50),
+            )
         
-        success, message = file_manager.apply_diff(path, original, modified)
+        success, message = await asyncio.to_thread(
+            self._file_manager.apply_diff, path, original, modified
+        )
+        self._files_changed()
         if not success:
-            logger.error(f"MCP Tool change_in_file FAILED: {message}")
+            logger.error("MCP Tool change_in_file FAILED: %s", message)
             return f"Error: {message}"
         
-        logger.info(f"MCP Tool change_in_file SUCCESS: {message}")
+        logger.info("MCP Tool change_in_file SUCCESS: %s", message)
         return message
 
-    @mcp.tool()
-    async def list_files(path: str = ".", recursive: bool = False) -> Dict[str, Any]:
+    async def list_files(self, path: str = ".", recursive: bool = False) -> Dict[str, Any]:
         """List files and directories within a directory.
         
         Args:
@@ -101,11 +189,11 @@ def register_file_services(mcp: FastMCP, file_manager: FileManager) -> None:
         if not path:
             path = "."
             
-        logger.info(f"MCP Tool Call: list_files(path='{path}', recursive={recursive})")
+        logger.info("MCP Tool Call: list_files(path='%s', recursive=%s)", path, recursive)
         
-        success, results = file_manager.list_files(path, recursive)
+        success, results = await asyncio.to_thread(self._file_manager.list_files, path, recursive)
         if not success or isinstance(results, str):
-            logger.error(f"MCP Tool list_files FAILED: {results}")
+            logger.error("MCP Tool list_files FAILED: %s", results)
             return {
                 "success": False,
                 "message": f"Error: {results}",
@@ -113,21 +201,21 @@ def register_file_services(mcp: FastMCP, file_manager: FileManager) -> None:
             }
         
         if not results:
-            logger.info(f"MCP Tool list_files SUCCESS: Directory '{path}' is empty")
+            logger.info("MCP Tool list_files SUCCESS: Directory '%s' is empty", path)
             return {
                 "success": True,
                 "message": "Directory is empty.",
                 "files": []
             }
             
-        # Convert datetime objects to strings for JSON serialization
+        # Convert timestamps to strings for JSON serialization
+        fromtimestamp = datetime.fromtimestamp
         for item in results:
             if item["modified"] is not None:
-                from datetime import datetime
-                item["modified"] = datetime.fromtimestamp(item["modified"]).isoformat()
+                item["modified"] = fromtimestamp(item["modified"]).isoformat()
         
         # Return structured data
-        logger.info(f"MCP Tool list_files SUCCESS: Listed {len(results)} items in '{path}'")
+        logger.info("MCP Tool list_files SUCCESS: Listed %d items in '%s'", len(results), path)
         return {
             "success": True,
             "message": f"Listed {len(results)} items",
@@ -136,8 +224,8 @@ def register_file_services(mcp: FastMCP, file_manager: FileManager) -> None:
             "files": results
         }
 
-    @mcp.tool()
     async def find_files(
+        self,
         path: str, 
         pattern: Optional[str] = None,
         respect_gitignore: bool = True,
@@ -162,13 +250,14 @@ def register_file_services(mcp: FastMCP, file_manager: FileManager) -> None:
         """
         # Log tool call with all parameters for diagnostic purposes
         logger.info(
-            f"MCP Tool Call: find_files(path='{path}', pattern={pattern}, "
-            f"respect_gitignore={respect_gitignore}, file_type={file_type}, "
-            f"max_depth={max_depth}, min_size={min_size}, max_size={max_size})"
+            "MCP Tool Call: find_files(path='%s', pattern=%s, respect_gitignore=%s, "
+            "file_type=%s, max_depth=%s, min_size=%s, max_size=%s)",
+            path, pattern, respect_gitignore, file_type, max_depth, min_size, max_size,
         )
         
         # Call the core file manager method
-        success, results = file_manager.find_files(
+        success, results = await asyncio.to_thread(
+            self._file_manager.find_files,
             path=path,
             pattern=pattern,
             respect_gitignore=respect_gitignore,
@@ -179,7 +268,7 @@ def register_file_services(mcp: FastMCP, file_manager: FileManager) -> None:
         )
         
         if not success or isinstance(results, str):
-            logger.error(f"MCP Tool find_files FAILED: {results}")
+            logger.error("MCP Tool find_files FAILED: %s", results)
             return {
                 "success": False,
                 "message": f"Error: {results}",
@@ -187,18 +276,18 @@ def register_file_services(mcp: FastMCP, file_manager: FileManager) -> None:
             }
         
         if not results:
-            logger.info(f"MCP Tool find_files SUCCESS: No files found matching criteria in '{path}'")
+            logger.info("MCP Tool find_files SUCCESS: No files found matching criteria in '%s'", path)
             return {
                 "success": True,
                 "message": "No files found matching the specified criteria.",
                 "files": []
             }
             
-        # Convert datetime objects to strings for JSON serialization
+        # Convert timestamps to strings for JSON serialization
+        fromtimestamp = datetime.fromtimestamp
         for item in results:
             if item["modified"] is not None:
-                from datetime import datetime
-                item["modified"] = datetime.fromtimestamp(item["modified"]).isoformat()
+                item["modified"] = fromtimestamp(item["modified"]).isoformat()
         
         # Return structured data
         result_summary = (
@@ -207,7 +296,7 @@ def register_file_services(mcp: FastMCP, file_manager: FileManager) -> None:
             f"{' (respecting .gitignore)' if respect_gitignore else ''}"
         )
         
-        logger.info(f"MCP Tool find_files SUCCESS: {result_summary}")
+        logger.info("MCP Tool find_files SUCCESS: %s", result_summary)
         return {
             "success": True,
             "message": result_summary,
@@ -219,8 +308,7 @@ def register_file_services(mcp: FastMCP, file_manager: FileManager) -> None:
             "files": results
         }
     
-    @mcp.tool()
-    async def grep_files(pattern: str, path: str, file_pattern: Optional[str] = None) -> str:
+    async def grep_files(self, pattern: str, path: str, file_pattern: Optional[str] = None) -> str:
         """Search for a pattern in files.
         
         Args:
@@ -231,24 +319,48 @@ def register_file_services(mcp: FastMCP, file_manager: FileManager) -> None:
         Returns:
             Search results or an error message.
         """
-        file_pattern_info = f", file_pattern='{file_pattern}'" if file_pattern else ""
-        logger.info(f"MCP Tool Call: search_files(pattern='{pattern}', path='{path}'{file_pattern_info})")
+        logger.info(
+            "MCP Tool Call: search_files(pattern='%s', path='%s'%s)",
+            pattern, path, f", file_pattern='{file_pattern}'" if file_pattern else "",
+        )
         
-        success, results = file_manager.grep_files(pattern, path, file_pattern)
+        success, results = await asyncio.to_thread(
+            self._file_manager.grep_files, pattern, path, file_pattern
+        )
         if not success or isinstance(results, str):
-            logger.error(f"MCP Tool search_files FAILED: {results}")
+            logger.error("MCP Tool search_files FAILED: %s", results)
             return f"Error: {results}"
         
         # Format search results
         if not results:
-            logger.info(f"MCP Tool search_files SUCCESS: No matches found for pattern '{pattern}' in '{path}'")
+            logger.info(
+                "MCP Tool search_files SUCCESS: No matches found for pattern '%s' in '%s'",
+                pattern, path,
+            )
             return "No matches found."
             
-        formatted_results = []
-        for match in results:
-            formatted_results.append(
-                f"File: {match['path']}, Line {match['line']}: {match['content']}"
-            )
-        
-        logger.info(f"MCP Tool search_files SUCCESS: Found {len(results)} matches for pattern '{pattern}' in '{path}'")
-        return "\n".join(formatted_results)
+        logger.info(
+            "MCP Tool search_files SUCCESS: Found %d matches for pattern '%s' in '%s'",
+            len(results), pattern, path,
+        )
+        return "\n".join(
+            f"File: {match['path']}, Line {match['line']}: {match['content']}"
+            for match in results
+        )
+
+
+def register_file_services(
+    mcp: FastMCP,
+    file_manager: FileManager,
+    version_control_manager: Optional[VersionControlManager] = None,
+) -> None:
+    """Register file operation MCP services.
+
+    Args:
+        mcp: MCP server instance.
+        file_manager: File manager instance.
+        version_control_manager: Optional version control manager whose
+            cached `git status` results are discarded when a file is written.
+    """
+    logger.info("Registering file management MCP services")
+    FileServices(file_manager, version_control_manager).register(mcp)
@@ -1,27 +1,350 @@
 """MCP services for Git operations."""
 
+import asyncio
+import functools
+import inspect
 import logging
-from pathlib import Path
-from typing import Dict, List, Optional, Any, Union
+from collections import OrderedDict
+from contextlib import aclosing
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple, TypeVar, Union
 
 from mcp.server import FastMCP
+from mcp.server.fastmcp import Context
 
 from simply_maestro.core import VersionControlManager
+from simply_maestro.core.version_control import (
+    DEFAULT_DIFF_PREVIEW_BYTES,
+    DEFAULT_MAX_OUTPUT_BYTES,
+    LOG_FORMATS,
+)
 
 logger = logging.getLogger(__name__)
 
+_T = TypeVar("_T")
 
-def register_git_services(mcp: FastMCP, version_control_manager: VersionControlManager) -> None:
-    """Register Git operation MCP services.
+# Largest number of commits the log tools return
+MAX_LOG_COUNT = 1000
+
+# Number of log entries between progress reports
+_LOG_PROGRESS_INTERVAL = 100
+
+# Descriptions of porcelain status codes, as used by `git status`
+_STATUS_LABELS = {
+    "M": "modified",
+    "A": "new file",
+    "D": "deleted",
+    "R": "renamed",
+    "C": "copied",
+    "T": "typechange",
+}
+
+# Descriptions of the porcelain codes of unmerged paths, by both columns
+_UNMERGED_LABELS = {
+    "DD": "both deleted",
+    "AU": "added by us",
+    "UD": "deleted by them",
+    "UA": "added by them",
+    "DU": "deleted by us",
+    "AA": "both added",
+    "UU": "both modified",
+}
+
+# Widths git pads the labels of changed and unmerged paths to, one more than
+# the longest label of each kind
+_STATUS_LABEL_WIDTH = len("typechange:") + 1
+_UNMERGED_LABEL_WIDTH = len("deleted by them:") + 1
+
+
+async def _report_progress(
+    ctx: Optional[Context], progress: float, total: Optional[float], message: str
+) -> None:
+    """Report the progress of a tool call to the client.
 
     Args:
-        mcp: MCP server instance.
-        version_control_manager: Version control manager instance.
+        ctx: MCP request context of the tool call, if any.
+        progress: Progress so far.
+        total: Total expected progress, if known.
+        message: Description of the work in progress.
     """
-    logger.info("Registering Git operation MCP services")
-    
-    @mcp.tool()
-    async def git_commit(message: str, files: Optional[List[str]] = None) -> str:
+    if ctx is None:
+        return
+    try:
+        await ctx.report_progress(progress, total, message=message)
+    except ValueError:
+        # Called in-process rather than for a client request, so there is
+        # nobody to report to
+        pass
+    except Exception as e:
+        # Progress is best effort: work shared with other calls must not fail
+        # because the request that started it has gone away
+        logger.debug("Failed to report progress: %s", e)
+
+
+def _coalesced(
+    method: Callable[..., Awaitable[_T]]
+) -> Callable[..., Awaitable[_T]]:
+    """Share the result of a read-only tool between identical concurrent calls.
+
+    A call made while an identical one is running waits for that one's result
+    instead of running git again. Calls made after a write tool has finished,
+    or after files were changed through the version control manager's cache
+    invalidation, never join work started before it.
+
+    Args:
+        method: GitServices tool method to wrap.
+
+    Returns:
+        The wrapped method.
+    """
+    signature = inspect.signature(method)
+
+    @functools.wraps(method)
+    async def wrapper(self: "GitServices", *args: Any, **kwargs: Any) -> _T:
+        bound = signature.bind(self, *args, **kwargs)
+        bound.apply_defaults()
+        # The request context only affects where progress is reported
+        key = (
+            self._write_generation,
+            self._version_control_manager.status_generation,
+            method.__name__,
+            *(value for name, value in bound.arguments.items() if name not in ("self", "ctx")),
+        )
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(method(self, *args, **kwargs))
+            self._inflight[key] = task
+
+            def forget(done: "asyncio.Future[Any]") -> None:
+                if self._inflight.get(key) is done:
+                    del self._inflight[key]
+
+            task.add_done_callback(forget)
+        # A cancelled caller must not cancel the work the others are waiting for
+        return await asyncio.shield(task)
+
+    return wrapper
+
+
+def _exclusive(
+    method: Callable[..., Awaitable[_T]]
+) -> Callable[..., Awaitable[_T]]:
+    """Run a tool that changes the repository without other such tools running.
+
+    Concurrent writes would otherwise race for `.git/index.lock` and fail.
+
+    Args:
+        method: GitServices tool method to wrap.
+
+    Returns:
+        The wrapped method.
+    """
+
+    @functools.wraps(method)
+    async def wrapper(self: "GitServices", *args: Any, **kwargs: Any) -> _T:
+        async with self._write_lock:
+            try:
+                return await method(self, *args, **kwargs)
+            finally:
+                # Reads started before this write finished may be out of date
+                self._write_generation += 1
+
+    return wrapper
+
+
+def _describe_branch(header: str, head: Optional[str] = None) -> List[str]:
+    """Describe the branch from a `git status --porcelain --branch` header.
+
+    Args:
+        header: Branch header line, without the leading "## ".
+        head: Abbreviated commit HEAD points to, shown when it is detached.
+
+    Returns:
+        Lines describing the branch and how it compares to its upstream.
+    """
+    if header.startswith("No commits yet on "):
+        return [f"On branch {header[len('No commits yet on '):]}", "", "No commits yet"]
+    if header == "HEAD (no branch)":
+        return [f"HEAD detached at {head}" if head else "HEAD detached"]
+
+    branch, _, tracking = header.partition("...")
+    lines = [f"On branch {branch}"]
+    if not tracking:
+        return lines
+
+    upstream, _, divergence = tracking.partition(" ")
+    counts = dict(
+        item.split(" ") for item in divergence.strip("[]").split(", ") if " " in item
+    )
+    if divergence == "[gone]":
+        lines.append(f"Your branch is based on '{upstream}', but the upstream is gone.")
+    elif "ahead" in counts and "behind" in counts:
+        lines.append(f"Your branch and '{upstream}' have diverged.")
+    elif "ahead" in counts:
+        lines.append(f"Your branch is ahead of '{upstream}' by {counts['ahead']} commit(s).")
+    elif "behind" in counts:
+        lines.append(f"Your branch is behind '{upstream}' by {counts['behind']} commit(s).")
+    else:
+        lines.append(f"Your branch is up to date with '{upstream}'.")
+    return lines
+
+
+def _describe_status(header: str, files: List[str], head: Optional[str] = None) -> str:
+    """Render porcelain status output in the layout of plain `git status`.
+
+    The advice hints git adds (as with `advice.statusHints`) and the notes on
+    merges or rebases in progress are left out.
+
+    Args:
+        header: Branch header line, without the leading "## ".
+        files: Porcelain status lines for the changed files.
+        head: Abbreviated commit HEAD points to, shown when it is detached.
+
+    Returns:
+        Human-readable status.
+    """
+    staged: List[str] = []
+    unstaged: List[str] = []
+    unmerged: List[str] = []
+    untracked: List[str] = []
+    for line in files:
+        index, worktree, path = line[0], line[1], line[3:]
+        if index == "?":
+            untracked.append(f"\t{path}")
+        elif index + worktree in _UNMERGED_LABELS:
+            label = f"{_UNMERGED_LABELS[index + worktree]}:"
+            unmerged.append(f"\t{label:<{_UNMERGED_LABEL_WIDTH}}{path}")
+        else:
+            if index != " ":
+                label = f"{_STATUS_LABELS.get(index, index)}:"
+                staged.append(f"\t{label:<{_STATUS_LABEL_WIDTH}}{path}")
+            if worktree != " ":
+                label = f"{_STATUS_LABELS.get(worktree, worktree)}:"
+                unstaged.append(f"\t{label:<{_STATUS_LABEL_WIDTH}}{path}")
+
+    lines = _describe_branch(header, head)
+    sections = [
+        [title, *entries]
+        for title, entries in (
+            ("Changes to be committed:", staged),
+            ("Unmerged paths:", unmerged),
+            ("Changes not staged for commit:", unstaged),
+            ("Untracked files:", untracked),
+        )
+        if entries
+    ] or [["nothing to commit, working tree clean"]]
+    # Like git, only separate the first section from a multi-line branch description
+    for section in sections:
+        if len(lines) > 1:
+            lines.append("")
+        lines.extend(section)
+    if not staged:
+        if unstaged or unmerged:
+            lines.extend(("", "no changes added to commit"))
+        elif untracked:
+            lines.extend(("", "nothing added to commit but untracked files present"))
+    return "\n".join(lines)
+
+
+class _GitCache:
+    """Least recently used cache of tool results that depend only on HEAD and the refs."""
+
+    def __init__(self, max_entries: int = 64) -> None:
+        """Initialize the cache.
+
+        Args:
+            max_entries: Maximum number of results to keep.
+        """
+        self._max_entries = max_entries
+        # Refs state the cached results were computed for
+        self._refs_state: Optional[Tuple[Any, ...]] = None
+        self._results: "OrderedDict[Tuple[Any, ...], Dict[str, Any]]" = OrderedDict()
+
+    def get(
+        self, refs_state: Optional[Tuple[Any, ...]], key: Tuple[Any, ...]
+    ) -> Optional[Dict[str, Any]]:
+        """Look up a cached result.
+
+        Args:
+            refs_state: Current state of the refs, from get_refs_state.
+            key: Tool name and arguments.
+
+        Returns:
+            The cached result, or None if there is no result for this state.
+        """
+        if refs_state is None or refs_state != self._refs_state:
+            return None
+        result = self._results.get(key)
+        if result is not None:
+            self._results.move_to_end(key)
+        return result
+
+    def put(
+        self, refs_state: Optional[Tuple[Any, ...]], key: Tuple[Any, ...], result: Dict[str, Any]
+    ) -> None:
+        """Cache a result.
+
+        Args:
+            refs_state: State of the refs from before the result was computed.
+            key: Tool name and arguments.
+            result: Result to cache.
+        """
+        if refs_state is None:
+            return
+        if refs_state != self._refs_state:
+            # Results for older states can never be used again
+            self._refs_state = refs_state
+            self._results.clear()
+        self._results[key] = result
+        self._results.move_to_end(key)
+        if len(self._results) > self._max_entries:
+            self._results.popitem(last=False)
+
+
+class GitServices:
+    """Git operation MCP tools for Simply Maestro."""
+
+    # Methods registered as MCP tools
+    TOOLS = (
+        "git_commit",
+        "git_add",
+        "git_restore",
+        "git_status",
+        "git_log",
+        "git_show",
+        "git_diff",
+        "repo_snapshot",
+        "git_branch",
+        "git_create_tag",
+        "git_list_tags",
+    )
+
+    def __init__(self, version_control_manager: VersionControlManager) -> None:
+        """Initialize the services.
+
+        Args:
+            version_control_manager: Version control manager instance.
+        """
+        self._version_control_manager = version_control_manager
+        # Results of the tools that only read commits and refs
+        self._cache = _GitCache()
+        # Running read-only tool calls, keyed by write generation, tool name
+        # and arguments, so identical calls can share them
+        self._inflight: Dict[Tuple[Any, ...], "asyncio.Future[Any]"] = {}
+        # Serializes the tools that change the repository, and counts them
+        self._write_lock = asyncio.Lock()
+        self._write_generation = 0
+
+    def register(self, mcp: FastMCP) -> None:
+        """Register the tools with an MCP server.
+
+        Args:
+            mcp: MCP server instance.
+        """
+        for name in self.TOOLS:
+            mcp.tool()(getattr(self, name))
+
+    @_exclusive
+    async def git_commit(self, message: str, files: Optional[List[str]] = None) -> str:
         """Commit changes to the Git repository.
         
         Args:
@@ -31,21 +354,20 @@ def register_git_services(mcp: FastMCP, version_control_manager: VersionControlM
         Returns:
             A message indicating success or failure.
         """
-        files_str = str(files) if files else "all changes"
-        logger.info(f"MCP Tool Call: git_commit(message='{message}', files={files_str})")
+        logger.info("MCP Tool Call: git_commit(message='%s', files=%s)", message, files or "all changes")
         
-        file_paths = [Path(f) for f in files] if files else None
-        success, result = version_control_manager.commit(message, file_paths)
+        # Paths are passed to git as given, so there is no need to wrap them
+        success, result = await self._version_control_manager.commit(message, files or None)
         
         if not success:
-            logger.error(f"MCP Tool git_commit FAILED: {result}")
+            logger.error("MCP Tool git_commit FAILED: %s", result)
             return f"Error: {result}"
         
-        logger.info(f"MCP Tool git_commit SUCCESS: {result}")
+        logger.info("MCP Tool git_commit SUCCESS: %s", result)
         return result
 
-    @mcp.tool()
-    async def git_add(files: List[str]) -> str:
+    @_exclusive
+    async def git_add(self, files: List[str]) -> str:
         """Add files to the Git staging area.
         
         Args:
@@ -54,20 +376,19 @@ def register_git_services(mcp: FastMCP, version_control_manager: VersionControlM
         Returns:
             A message indicating success or failure.
         """
-        logger.info(f"MCP Tool Call: git_add(files={files})")
+        logger.info("MCP Tool Call: git_add(files=%s)", files)
         
-        file_paths = [Path(f) for f in files]
-        success, message = version_control_manager.stage_files(file_paths)
+        success, message = await self._version_control_manager.stage_files(files)
         
         if not success:
-            logger.error(f"MCP Tool git_add FAILED: {message}")
+            logger.error("MCP Tool git_add FAILED: %s", message)
             return f"Error: {message}"
         
-        logger.info(f"MCP Tool git_add SUCCESS: {message}")
+        logger.info("MCP Tool git_add SUCCESS: %s", message)
         return message
         
-    @mcp.tool()
-    async def git_restore(files: List[str], staged: bool = False) -> str:
+    @_exclusive
+    async def git_restore(self, files: List[str], staged: bool = False) -> str:
         """Restore files to their state in the last commit.
         
         Args:
@@ -77,84 +398,129 @@ def register_git_services(mcp: FastMCP, version_control_manager: VersionControlM
         Returns:
             A message indicating success or failure.
         """
-        logger.info(f"MCP Tool Call: git_restore(files={files}, staged={staged})")
+        logger.info("MCP Tool Call: git_restore(files=%s, staged=%s)", files, staged)
         
-        file_paths = [Path(f) for f in files]
-        success, message = version_control_manager.restore(file_paths, staged)
+        success, message = await self._version_control_manager.restore(files, staged)
         
         if not success:
-            logger.error(f"MCP Tool git_restore FAILED: {message}")
+            logger.error("MCP Tool git_restore FAILED: %s", message)
             return f"Error: {message}"
         
-        logger.info(f"MCP Tool git_restore SUCCESS: {message}")
+        logger.info("MCP Tool git_restore SUCCESS: %s", message)
         return message
     
-    @mcp.tool()
-    async def git_status() -> Dict[str, Any]:
+    @_coalesced
+    async def git_status(self) -> Dict[str, Any]:
         """Get the current status of the Git repository.
         
         Returns:
             A dictionary containing the status output or error message.
         """
-        logger.info(f"MCP Tool Call: git_status()")
+        logger.info("MCP Tool Call: git_status()")
         
-        # Get machine-readable status
-        success, porcelain_status = version_control_manager.get_status()
+        # Get the machine-readable status and branch with a single command
+        success, porcelain_status = await self._version_control_manager.get_combined_status()
         if not success:
-            logger.error(f"MCP Tool git_status FAILED: {porcelain_status}")
+            logger.error("MCP Tool git_status FAILED: %s", porcelain_status)
             return {"success": False, "message": f"Error: {porcelain_status}"}
-            
-        # Get human-readable status
-        success, detailed_status = version_control_manager.get_detailed_status()
-        if not success:
-            logger.error(f"MCP Tool git_status FAILED: {detailed_status}")
-            return {"success": False, "message": f"Error: {detailed_status}"}
-        
-        # Count changed files
-        changed_files = len([line for line in porcelain_status.split("\n") if line])
-        logger.info(f"MCP Tool git_status SUCCESS: Repository has {changed_files} changed files")
+
+        # Build the human-readable status from it rather than running git again
+        header, _, porcelain_status = porcelain_status.partition("\n")
+        header = header[3:]
+        files = [line for line in porcelain_status.split("\n") if line]
+        head = None
+        if header == "HEAD (no branch)":
+            # The header doesn't say where HEAD is detached
+            resolved = await self._version_control_manager.resolve_ref("HEAD")
+            if resolved is not None:
+                head = resolved[0][:7]
+        detailed_status = _describe_status(header, files, head)
+
+        logger.info("MCP Tool git_status SUCCESS: Repository has %d changed files", len(files))
             
         return {
             "success": True,
             "status": detailed_status,
-            "files": [line for line in porcelain_status.split("\n") if line]
+            "files": files
         }
     
-    @mcp.tool()
-    async def git_log(count: int = 10, all_branches: bool = False, 
-                     format: str = "oneline") -> Dict[str, Any]:
+    @_coalesced
+    async def git_log(self, count: int = 10, all_branches: bool = False, 
+                     format: str = "oneline", ctx: Optional[Context] = None) -> Dict[str, Any]:
         """Get the commit history of the Git repository.
         
         Args:
-            count: Number of commits to retrieve (default: 10).
+            count: Number of commits to retrieve (default: 10, at most 1000).
             all_branches: If True, shows commits from all branches (default: False).
             format: Format of the log output (default: "oneline").
                 Options: "oneline", "short", "medium", "full", "fuller"
+            ctx: MCP request context, used to report progress as entries are read.
             
         Returns:
             A dictionary containing the log output or error message.
         """
-        logger.info(f"MCP Tool Call: git_log(count={count}, all_branches={all_branches}, format='{format}')")
-        
-        success, log_output = version_control_manager.get_log(count, all_branches, format)
-        if not success:
-            logger.error(f"MCP Tool git_log FAILED: {log_output}")
-            return {"success": False, "message": f"Error: {log_output}"}
-            
-        # Split the log output into lines for easier parsing
-        log_entries = [line for line in log_output.split("\n") if line]
-        
-        logger.info(f"MCP Tool git_log SUCCESS: Retrieved {len(log_entries)} commits")
-        return {
+        logger.info("MCP Tool Call: git_log(count=%d, all_branches=%s, format='%s')", count, all_branches, format)
+        count = max(1, min(count, MAX_LOG_COUNT))
+
+        # The default format shows relative dates, which go stale
+        refs_state = (
+            await self._version_control_manager.get_refs_state()
+            if format in LOG_FORMATS
+            else None
+        )
+        cache_key = ("git_log", count, all_branches, format)
+        cached = self._cache.get(refs_state, cache_key)
+        if cached is not None:
+            logger.info("MCP Tool git_log SUCCESS: Retrieved %d commits (cached)", cached["count"])
+            return cached
+
+        # Collect lines as git produces them, stopping git once the output
+        # reaches the size limit rather than reading all of it first
+        log_entries: List[str] = []
+        output_size = 0
+        truncated = False
+        # Multi-line formats start each commit with a "commit <hash>" line,
+        # the others show a commit per line
+        multi_line = format in LOG_FORMATS and format != "oneline"
+        commits = 0
+        try:
+            # Close the iterator on leaving the loop, so git is stopped right away
+            # rather than when the iterator is garbage collected
+            async with aclosing(
+                self._version_control_manager.iter_log(count, all_branches, format)
+            ) as lines:
+                async for line in lines:
+                    output_size += len(line.encode("utf-8")) + 1
+                    if output_size > DEFAULT_MAX_OUTPUT_BYTES:
+                        truncated = True
+                        break
+                    if not line:
+                        continue
+                    log_entries.append(line)
+                    if multi_line and not line.startswith("commit "):
+                        continue
+                    commits += 1
+                    if commits % _LOG_PROGRESS_INTERVAL == 0:
+                        await _report_progress(ctx, commits, count, "Reading git log")
+        except RuntimeError as e:
+            logger.error("MCP Tool git_log FAILED: %s", e)
+            return {"success": False, "message": f"Error: {str(e)}"}
+
+        entry_count = len(log_entries)
+        logger.info("MCP Tool git_log SUCCESS: Retrieved %d commits", entry_count)
+        result = {
             "success": True,
-            "count": len(log_entries),
+            "count": entry_count,
             "format": format,
             "all_branches": all_branches,
-            "entries": log_entries
+            "entries": log_entries,
+            "truncated": truncated
         }
+        self._cache.put(refs_state, cache_key, result)
+        return result
     
-    @mcp.tool()
-    async def git_show(commit_hash: str = "HEAD") -> Dict[str, Any]:
+    @_coalesced
+    async def git_show(self, commit_hash: str = "HEAD") -> Dict[str, Any]:
         """Show details of a specific commit.
         
         Args:
@@ -163,57 +529,130 @@ def register_git_services(mcp: FastMCP, version_control_manager: VersionControlM
         Returns:
             A dictionary containing the commit details or error message.
         """
-        logger.info(f"MCP Tool Call: git_show(commit_hash='{commit_hash}')")
-        
-        success, show_output = version_control_manager.get_show(commit_hash)
+        logger.info("MCP Tool Call: git_show(commit_hash='%s')", commit_hash)
+
+        refs_state = await self._version_control_manager.get_refs_state()
+        cache_key = ("git_show", commit_hash)
+        cached = self._cache.get(refs_state, cache_key)
+        if cached is not None:
+            logger.info("MCP Tool git_show SUCCESS: Retrieved details for commit '%s' (cached)", commit_hash)
+            return cached
+
+        success, show_output = await self._version_control_manager.get_show(commit_hash)
         if not success:
-            logger.error(f"MCP Tool git_show FAILED: {show_output}")
+            logger.error("MCP Tool git_show FAILED: %s", show_output)
             return {"success": False, "message": f"Error: {show_output}"}
         
-        output_preview = show_output[:100] + "..." if len(show_output) > 100 else show_output
-        logger.info(f"MCP Tool git_show SUCCESS: Retrieved details for commit '{commit_hash}', preview: {output_preview}")
+        # Only build the preview when it will be logged
+        if logger.isEnabledFor(logging.INFO):
+            output_preview = show_output[:100] + "..." if len(show_output) > 100 else show_output
+            logger.info(
+                "MCP Tool git_show SUCCESS: Retrieved details for commit '%s', preview: %s",
+                commit_hash, output_preview,
+            )
             
-        return {
+        result = {
             "success": True,
             "commit": commit_hash,
             "details": show_output
         }
+        self._cache.put(refs_state, cache_key, result)
+        return result
     
-    @mcp.tool()
-    async def git_diff(file_path: Optional[str] = None, staged: bool = False) -> Dict[str, Any]:
+    @_coalesced
+    async def git_diff(self, file_path: Optional[str] = None, staged: bool = False,
+                       ctx: Optional[Context] = None) -> Dict[str, Any]:
         """Get the diff of files in the repository.
         
         Args:
             file_path: Optional path to a specific file.
             staged: If True, shows diff for staged changes (default: False).
+            ctx: MCP request context, used to report progress as the diff is read.
             
         Returns:
-            A dictionary containing the diff output or error message.
+            A dictionary containing the diff output or error message. Large
+            diffs are cut short, which is indicated by the truncated flag.
         """
-        file_info = f"file='{file_path}'" if file_path else "all files"
-        logger.info(f"MCP Tool Call: git_diff({file_info}, staged={staged})")
+        logger.info("MCP Tool Call: git_diff(file=%s, staged=%s)", file_path or "all files", staged)
         
-        success, diff_output = version_control_manager.get_diff(
-            Path(file_path) if file_path else None, 
-            staged
+        async def progress(received: int) -> None:
+            await _report_progress(ctx, received, DEFAULT_DIFF_PREVIEW_BYTES, "Reading git diff")
+
+        # Only return the beginning of large diffs, and say so
+        success, diff_output, truncated = await self._version_control_manager.get_diff_preview(
+            file_path or None,
+            staged,
+            progress=progress
         )
         if not success:
-            logger.error(f"MCP Tool git_diff FAILED: {diff_output}")
+            logger.error("MCP Tool git_diff FAILED: %s", diff_output)
             return {"success": False, "message": f"Error: {diff_output}"}
         
-        # Count lines of diff for logging
-        diff_lines = len(diff_output.split("\n"))
-        logger.info(f"MCP Tool git_diff SUCCESS: Retrieved {diff_lines} lines of diff for {file_info}, staged={staged}")
+        # Count lines of diff for logging. Previews that were cut short end
+        # with a newline, while complete diffs are stripped.
+        diff_lines = diff_output.count("\n") + (
+            0 if not diff_output or diff_output.endswith("\n") else 1
+        )
+        logger.info(
+            "MCP Tool git_diff SUCCESS: Retrieved %d lines of diff for %s, staged=%s",
+            diff_lines, file_path or "all files", staged,
+        )
             
         return {
             "success": True,
             "staged": staged,
             "file": file_path,
-            "diff": diff_output
+            "diff": diff_output,
+            "truncated": truncated
         }
     
-    @mcp.tool()
-    async def git_branch(all_branches: bool = False) -> Dict[str, Any]:
+    @_coalesced
+    async def repo_snapshot(self, count: int = 10) -> Dict[str, Any]:
+        """Get the status, recent history, and unstaged diff of the repository at once.
+
+        Args:
+            count: Number of commits to include in the history (default: 10, at most 1000).
+
+        Returns:
+            A dictionary containing the status, log, and diff, or error message.
+        """
+        logger.info("MCP Tool Call: repo_snapshot(count=%d)", count)
+        count = max(1, min(count, MAX_LOG_COUNT))
+
+        # The three commands are independent, so run them concurrently
+        (
+            (status_success, status_output),
+            (log_success, log_output),
+            (diff_success, diff_output),
+        ) = await asyncio.gather(
+            self._version_control_manager.get_status(),
+            self._version_control_manager.get_log(count),
+            self._version_control_manager.get_diff(),
+        )
+        for success, output in (
+            (status_success, status_output),
+            (log_success, log_output),
+            (diff_success, diff_output),
+        ):
+            if not success:
+                logger.error("MCP Tool repo_snapshot FAILED: %s", output)
+                return {"success": False, "message": f"Error: {output}"}
+
+        files = [line for line in status_output.split("\n") if line]
+        log_entries = [line for line in log_output.split("\n") if line]
+        logger.info(
+            "MCP Tool repo_snapshot SUCCESS: %d changed files, %d commits",
+            len(files), len(log_entries),
+        )
+        return {
+            "success": True,
+            "files": files,
+            "entries": log_entries,
+            "diff": diff_output
+        }
+
+    @_coalesced
+    async def git_branch(self, all_branches: bool = False) -> Dict[str, Any]:
         """Get the list of branches in the repository.
         
         Args:
@@ -222,34 +661,51 @@ def register_git_services(mcp: FastMCP, version_control_manager: VersionControlM
         Returns:
             A dictionary containing the branch list or error message.
         """
-        logger.info(f"MCP Tool Call: git_branch(all_branches={all_branches})")
-        
-        success, branch_output = version_control_manager.get_branch_list(all_branches)
+        logger.info("MCP Tool Call: git_branch(all_branches=%s)", all_branches)
+
+        refs_state = await self._version_control_manager.get_refs_state()
+        cache_key = ("git_branch", all_branches)
+        cached = self._cache.get(refs_state, cache_key)
+        if cached is not None:
+            logger.info(
+                "MCP Tool git_branch SUCCESS: Found %d branches, current branch: %s (cached)",
+                len(cached["branches"]), cached["current_branch"],
+            )
+            return cached
+
+        success, branch_output = await self._version_control_manager.get_branch_list(all_branches)
         if not success:
-            logger.error(f"MCP Tool git_branch FAILED: {branch_output}")
+            logger.error("MCP Tool git_branch FAILED: %s", branch_output)
             return {"success": False, "message": f"Error: {branch_output}"}
             
-        # Parse branch output
-        branches = [line.strip() for line in branch_output.split("\n") if line.strip()]
+        # Parse branch output, picking out the current branch (marked with *)
+        branches = []
         current_branch = None
-        
-        # Find the current branch (marked with *)
-        for i, branch in enumerate(branches):
+        for line in branch_output.split("\n"):
+            branch = line.strip()
+            if not branch:
+                continue
             if branch.startswith("*"):
-                current_branch = branch[1:].strip()
-                branches[i] = branch[1:].strip()
+                branch = branch[1:].strip()
+                current_branch = branch
+            branches.append(branch)
         
-        logger.info(f"MCP Tool git_branch SUCCESS: Found {len(branches)} branches, current branch: {current_branch}")
+        logger.info(
+            "MCP Tool git_branch SUCCESS: Found %d branches, current branch: %s",
+            len(branches), current_branch,
+        )
                 
-        return {
+        result = {
             "success": True,
             "all_branches": all_branches,
             "current_branch": current_branch,
             "branches": branches
         }
+        self._cache.put(refs_state, cache_key, result)
+        return result
         
-    @mcp.tool()
-    async def git_create_tag(tag_name: str, message: Optional[str] = None, 
+    @_exclusive
+    async def git_create_tag(self, tag_name: str, message: Optional[str] = None, 
                             annotated: bool = True, force: bool = False) -> Dict[str, Any]:
         """Create a tag in the Git repository.
         
@@ -262,40 +718,54 @@ def register_git_services(mcp: FastMCP, version_control_manager: VersionControlM
         Returns:
             A dictionary containing result information.
         """
-        logger.info(f"MCP Tool Call: git_create_tag(tag_name='{tag_name}', message='{message}', annotated={annotated}, force={force})")
+        logger.info(
+            "MCP Tool Call: git_create_tag(tag_name='%s', message='%s', annotated=%s, force=%s)",
+            tag_name, message, annotated, force,
+        )
         
-        success, result = version_control_manager.create_tag(tag_name, message, annotated, force)
+        success, result = await self._version_control_manager.create_tag(tag_name, message, annotated, force)
         if not success:
-            logger.error(f"MCP Tool git_create_tag FAILED: {result}")
+            logger.error("MCP Tool git_create_tag FAILED: %s", result)
             return {"success": False, "message": f"Error: {result}"}
             
-        logger.info(f"MCP Tool git_create_tag SUCCESS: {result}")
+        logger.info("MCP Tool git_create_tag SUCCESS: %s", result)
         return {
             "success": True,
             "tag_name": tag_name,
             "message": result
         }
         
-    @mcp.tool()
-    async def git_list_tags() -> Dict[str, Any]:
+    @_coalesced
+    async def git_list_tags(self) -> Dict[str, Any]:
         """List all tags in the Git repository.
         
         Returns:
             A dictionary containing the list of tags or error message.
         """
-        logger.info(f"MCP Tool Call: git_list_tags()")
+        logger.info("MCP Tool Call: git_list_tags()")
         
-        success, tags_output = version_control_manager.list_tags()
+        success, tags_output = await self._version_control_manager.list_tags()
         if not success:
-            logger.error(f"MCP Tool git_list_tags FAILED: {tags_output}")
+            logger.error("MCP Tool git_list_tags FAILED: %s", tags_output)
             return {"success": False, "message": f"Error: {tags_output}"}
             
-        # Parse tags output
-        tags = [tag.strip() for tag in tags_output.split("\n") if tag.strip()]
+        # Parse tags output, stripping each line once
+        tags = [tag for line in tags_output.split("\n") if (tag := line.strip())]
         
-        logger.info(f"MCP Tool git_list_tags SUCCESS: Found {len(tags)} tags")
+        logger.info("MCP Tool git_list_tags SUCCESS: Found %d tags", len(tags))
         return {
             "success": True,
             "count": len(tags),
             "tags": tags
         }
+
+
+def register_git_services(mcp: FastMCP, version_control_manager: VersionControlManager) -> None:
+    """Register Git operation MCP services.
+
+    Args:
+        mcp: MCP server instance.
+        version_control_manager: Version control manager instance.
+    """
+    logger.info("Registering Git operation MCP services")
+    GitServices(version_control_manager).register(mcp)
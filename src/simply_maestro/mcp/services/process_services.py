@@ -4,7 +4,7 @@ import asyncio
 import logging
 import os
 from pathlib import Path
-from typing import Dict, Any, List, Optional
+from typing import Any, BinaryIO, Dict, List, Optional, Tuple
 
 from mcp.server import FastMCP
 
@@ -12,21 +12,163 @@ from simply_maestro.core import ProcessManager
 
 logger = logging.getLogger(__name__)
 
+# Default limit on the log content returned by read_process_log
+DEFAULT_LOG_READ_BYTES = 1024 * 1024
 
-def register_process_services(mcp: FastMCP, process_manager: ProcessManager) -> None:
-    """Register process management MCP services.
+# Limit on the log content served by the logs://{filename} resource
+MAX_LOG_RESOURCE_BYTES = 8 * 1024 * 1024
+
+# Size of the blocks read when scanning a log backwards for its last lines
+_TAIL_BLOCK_SIZE = 64 * 1024
+
+
+def _find_tail_start(log_file: BinaryIO, size: int, lines: int) -> int:
+    """Find where the last lines of a file start, reading it backwards.
 
     Args:
-        mcp: MCP server instance.
-        process_manager: Process manager instance.
+        log_file: File opened in binary mode.
+        size: Size of the file.
+        lines: Number of lines to find.
+
+    Returns:
+        Offset of the first of the last lines.
     """
-    logger.info("Registering process management MCP services")
-    
-    # Path to logs directory
-    logs_dir = Path("logs")
-    
-    @mcp.tool()
-    async def stop_task() -> str:
+    if lines <= 0:
+        return size
+
+    position = size
+    remaining = lines
+    while position > 0:
+        block_size = min(_TAIL_BLOCK_SIZE, position)
+        position -= block_size
+        log_file.seek(position)
+        block = log_file.read(block_size)
+        end = len(block)
+        if position + end == size and block.endswith(b"\n"):
+            # The newline ending the last line doesn't start another one
+            end -= 1
+        while (newline := block.rfind(b"\n", 0, end)) >= 0:
+            remaining -= 1
+            if remaining == 0:
+                return position + newline + 1
+            end = newline
+
+    return 0
+
+
+def _read_log(
+    log_path: Path, offset: int, max_bytes: int, tail_lines: Optional[int]
+) -> Tuple[str, int, int, int, bool]:
+    """Read part of a log file.
+
+    Args:
+        log_path: Path to the log file.
+        offset: Byte offset to start reading at, unless tail_lines is set.
+        max_bytes: Maximum number of bytes to read.
+        tail_lines: If set, read the last this many lines instead, keeping
+            the end of them if they don't fit in max_bytes.
+
+    Returns:
+        Tuple of (content, offset of the content, offset of its end, file
+        size, whether there is more of the requested content than was read).
+    """
+    with log_path.open("rb") as log_file:
+        size = os.fstat(log_file.fileno()).st_size
+        if tail_lines is not None:
+            tail_start = _find_tail_start(log_file, size, tail_lines)
+            # Keep the end of the lines if they don't all fit
+            truncated = tail_start < size - max_bytes
+            start = max(tail_start, size - max_bytes)
+        else:
+            start = min(offset, size)
+        log_file.seek(start)
+        data = log_file.read(max_bytes)
+
+    if tail_lines is None:
+        truncated = start + len(data) < size
+    # Offsets can fall inside a multi-byte character
+    return data.decode("utf-8", errors="replace"), start, start + len(data), size, truncated
+
+
+class ProcessServices:
+    """Process management MCP tools for Simply Maestro."""
+
+    # Methods registered as MCP tools
+    TOOLS = (
+        "stop_task",
+        "start_task",
+        "restart_task",
+        "list_process_logs",
+        "read_process_log",
+    )
+
+    def __init__(self, process_manager: ProcessManager) -> None:
+        """Initialize the services.
+
+        Args:
+            process_manager: Process manager instance.
+        """
+        self._process_manager = process_manager
+        # Path to logs directory
+        self._logs_dir = Path("logs")
+        # Prefix of the real paths of files inside the logs directory
+        self._logs_prefix = os.path.join(os.path.realpath(self._logs_dir), "")
+        # Names of the log files, with the modification time of the logs
+        # directory when they were listed
+        self._log_names: Optional[Tuple[int, List[str]]] = None
+
+    def register(self, mcp: FastMCP) -> None:
+        """Register the tools with an MCP server.
+
+        Args:
+            mcp: MCP server instance.
+        """
+        for name in self.TOOLS:
+            mcp.tool()(getattr(self, name))
+        mcp.resource(
+            "logs://{filename}", name="process_log", mime_type="text/plain"
+        )(self.read_log_resource)
+
+    def _resolve_log_path(self, filename: str) -> Optional[Path]:
+        """Resolve the path of a log file, if it is inside the logs directory.
+
+        The path is resolved first, so neither ".." nor symlinks can lead
+        outside of the logs directory.
+
+        Args:
+            filename: Name of the log file.
+
+        Returns:
+            The resolved path, or None if it is outside the logs directory.
+        """
+        log_path = Path(os.path.realpath(self._logs_dir / filename))
+        if not str(log_path).startswith(self._logs_prefix):
+            return None
+        return log_path
+
+    def _list_log_names(self) -> List[str]:
+        """List the names of the log files in the logs directory.
+
+        The directory is only read again once its modification time changes,
+        which happens whenever a file is added, removed, or renamed.
+
+        Returns:
+            Names of the log files.
+        """
+        mtime = self._logs_dir.stat().st_mtime_ns
+        if self._log_names is None or self._log_names[0] != mtime:
+            # scandir reports the entry type with each name, so unlike glob and
+            # is_file it needs no extra stat per entry on most file systems
+            with os.scandir(self._logs_dir) as entries:
+                names = [
+                    entry.name
+                    for entry in entries
+                    if entry.name.endswith(".log") and entry.is_file()
+                ]
+            self._log_names = (mtime, names)
+        return self._log_names[1]
+
+    async def stop_task(self) -> str:
         """Stop the managed process.
         
         Note: Since the target process has its own babysitter, Simply Maestro
@@ -35,18 +177,17 @@ def register_process_services(mcp: FastMCP, process_manager: ProcessManager) ->
         Returns:
             A message indicating success or failure.
         """
-        logger.info(f"MCP Tool Call: stop_task()")
+        logger.info("MCP Tool Call: stop_task()")
         
-        stop_success, stop_message = await process_manager.stop()
+        stop_success, stop_message = await self._process_manager.stop()
         if not stop_success:
-            logger.error(f"MCP Tool stop_task FAILED: {stop_message}")
+            logger.error("MCP Tool stop_task FAILED: %s", stop_message)
             return f"Error stopping process: {stop_message}"
         
-        logger.info(f"MCP Tool stop_task SUCCESS: {stop_message}")
+        logger.info("MCP Tool stop_task SUCCESS: %s", stop_message)
         return stop_message
 
-    @mcp.tool()
-    async def start_task() -> str:
+    async def start_task(self) -> str:
         """Monitor an existing managed process or start if needed.
         
         Note: This tool primarily attaches to an existing process for monitoring.
@@ -55,18 +196,17 @@ def register_process_services(mcp: FastMCP, process_manager: ProcessManager) ->
         Returns:
             A message indicating success or failure.
         """
-        logger.info(f"MCP Tool Call: start_task()")
+        logger.info("MCP Tool Call: start_task()")
         
-        success, message = await process_manager.start()
+        success, message = await self._process_manager.start()
         if not success:
-            logger.error(f"MCP Tool start_task FAILED: {message}")
+            logger.error("MCP Tool start_task FAILED: %s", message)
             return f"Error: {message}"
         
-        logger.info(f"MCP Tool start_task SUCCESS: {message}")
+        logger.info("MCP Tool start_task SUCCESS: %s", message)
         return message
 
-    @mcp.tool()
-    async def restart_task() -> str:
+    async def restart_task(self) -> str:
         """Emergency restart of the managed process.
         
         Note: This should only be used in emergency situations as the target
@@ -75,46 +215,39 @@ def register_process_services(mcp: FastMCP, process_manager: ProcessManager) ->
         Returns:
             A message indicating success or failure.
         """
-        logger.info(f"MCP Tool Call: restart_task() - EMERGENCY USE ONLY")
-        
-        # First ensure the process is fully stopped
-        logger.info(f"MCP Tool restart_task - Phase 1: Stopping process")
-        stop_success, stop_message = await process_manager.stop()
-        if not stop_success:
-            logger.error(f"MCP Tool restart_task FAILED during stop phase: {stop_message}")
-            return f"Error stopping process: {stop_message}"
-            
-        # Give it a moment to fully shut down
-        await asyncio.sleep(1.0)
+        logger.info("MCP Tool Call: restart_task() - EMERGENCY USE ONLY")
         
-        # Now start a fresh process, forcing a new process (don't try to attach to existing)
-        logger.info(f"MCP Tool restart_task - Phase 2: Starting new process")
-        start_success, start_message = await process_manager.start(force_new_process=True)
-        if not start_success:
-            logger.error(f"MCP Tool restart_task FAILED during start phase: {start_message}")
-            return f"Error starting process: {start_message}"
+        success, message = await self._process_manager.restart()
+        if not success:
+            logger.error("MCP Tool restart_task FAILED: %s", message)
+            return f"Error restarting process: {message}"
             
-        logger.info(f"MCP Tool restart_task SUCCESS: Process restarted with PID {process_manager._pid}")
-        return f"Process restarted successfully: {start_message}"
+        logger.info("MCP Tool restart_task SUCCESS: Process restarted with PID %s", self._process_manager._pid)
+        return f"Process restarted successfully: {message}"
     
-    @mcp.tool()
-    async def list_process_logs() -> Dict[str, Any]:
+    async def list_process_logs(self) -> Dict[str, Any]:
         """List available process log files.
         
         Returns:
             A dictionary containing log file information.
         """
-        logger.info(f"MCP Tool Call: list_process_logs()")
+        logger.info("MCP Tool Call: list_process_logs()")
         
         try:
-            if not logs_dir.exists():
-                logger.warning(f"MCP Tool list_process_logs: Logs directory not found at {logs_dir}")
+            if not self._logs_dir.exists():
+                logger.warning("MCP Tool list_process_logs: Logs directory not found at %s", self._logs_dir)
                 return {"success": False, "message": "Logs directory not found", "logs": []}
                 
             log_files = []
-            for log_file in logs_dir.glob("*.log"):
-                # Get file stats
-                stat = log_file.stat()
+            for name in self._list_log_names():
+                # Get file stats, which change as logs are written without
+                # changing the directory
+                log_file = self._logs_dir / name
+                try:
+                    stat = log_file.stat()
+                except FileNotFoundError:
+                    # Removed since the directory was listed
+                    continue
                 log_files.append({
                     "filename": log_file.name,
                     "path": str(log_file),
@@ -126,7 +259,7 @@ def register_process_services(mcp: FastMCP, process_manager: ProcessManager) ->
             # Sort by modified time, newest first
             log_files.sort(key=lambda x: x["modified"], reverse=True)
                 
-            logger.info(f"MCP Tool list_process_logs SUCCESS: Found {len(log_files)} log files")
+            logger.info("MCP Tool list_process_logs SUCCESS: Found %d log files", len(log_files))
             return {
                 "success": True,
                 "message": f"Found {len(log_files)} log files",
@@ -134,51 +267,136 @@ def register_process_services(mcp: FastMCP, process_manager: ProcessManager) ->
             }
         except Exception as e:
             error_msg = f"Failed to list log files: {str(e)}"
-            logger.error(f"MCP Tool list_process_logs FAILED: {error_msg}")
+            logger.error("MCP Tool list_process_logs FAILED: %s", error_msg)
             return {"success": False, "message": error_msg, "logs": []}
 
-    @mcp.tool()
-    async def read_process_log(filename: str) -> Dict[str, Any]:
+    async def read_process_log(
+        self,
+        filename: str,
+        tail_lines: Optional[int] = None,
+        offset: int = 0,
+        max_bytes: int = DEFAULT_LOG_READ_BYTES,
+    ) -> Dict[str, Any]:
         """Read the contents of a specific process log file.
         
         Args:
             filename: Name of the log file to read.
+            tail_lines: If set, read the last this many lines of the log.
+            offset: Byte offset to start reading at, when tail_lines is not set
+                (default: 0).
+            max_bytes: Maximum number of bytes to read (default: 1 MiB).
             
         Returns:
             A dictionary containing the log file content or error message.
+            The truncated flag is set when more of the requested content
+            remains, and next_offset is where to continue reading from.
         """
-        logger.info(f"MCP Tool Call: read_process_log(filename='{filename}')")
+        logger.info(
+            "MCP Tool Call: read_process_log(filename='%s', tail_lines=%s, offset=%d, max_bytes=%d)",
+            filename, tail_lines, offset, max_bytes,
+        )
+
+        if offset < 0 or max_bytes <= 0 or (tail_lines is not None and tail_lines < 0):
+            logger.warning("MCP Tool read_process_log FAILED: Invalid read window for '%s'", filename)
+            return {
+                "success": False,
+                "message": "Invalid read window: offset, max_bytes and tail_lines must not be negative"
+            }
         
         try:
-            log_path = logs_dir / filename
-            
             # Security check - ensure the file is within the logs directory
-            if not log_path.is_relative_to(logs_dir):
-                logger.warning(f"MCP Tool read_process_log security check FAILED: Path traversal attempt with '{filename}'")
+            log_path = self._resolve_log_path(filename)
+            if log_path is None:
+                logger.warning(
+                    "MCP Tool read_process_log security check FAILED: Path traversal attempt with '%s'",
+                    filename,
+                )
                 return {
                     "success": False, 
                     "message": "Invalid log file path"
                 }
                 
             if not log_path.exists() or not log_path.is_file():
-                logger.warning(f"MCP Tool read_process_log FAILED: Log file not found: {filename}")
+                logger.warning("MCP Tool read_process_log FAILED: Log file not found: %s", filename)
                 return {
                     "success": False, 
                     "message": f"Log file not found: {filename}"
                 }
                 
-            content = log_path.read_text(encoding="utf-8")
-            content_size = len(content)
-            
-            logger.info(f"MCP Tool read_process_log SUCCESS: Read {content_size} bytes from log file '{filename}'")
+            # Only read the requested window, in a worker thread
+            content, start, end, size, truncated = await asyncio.to_thread(
+                _read_log, log_path, offset, max_bytes, tail_lines
+            )
+
+            logger.info(
+                "MCP Tool read_process_log SUCCESS: Read bytes %d-%d of %d from log file '%s'",
+                start, end, size, filename,
+            )
             return {
                 "success": True,
                 "message": f"Read log file: {filename}",
                 "filename": filename,
                 "content": content,
-                "size": log_path.stat().st_size
+                "size": size,
+                "offset": start,
+                "next_offset": end,
+                "truncated": truncated
             }
         except Exception as e:
             error_msg = f"Failed to read log file {filename}: {str(e)}"
-            logger.error(f"MCP Tool read_process_log FAILED: {error_msg}")
+            logger.error("MCP Tool read_process_log FAILED: %s", error_msg)
             return {"success": False, "message": error_msg}
+
+    async def read_log_resource(self, filename: str) -> str:
+        """Read a process log file, served as the logs://{filename} resource.
+
+        Logs larger than MAX_LOG_RESOURCE_BYTES are cut short to their end,
+        with a notice; read_process_log can page through all of them.
+
+        Args:
+            filename: Name of the log file to read.
+
+        Returns:
+            The content of the log file.
+
+        Raises:
+            ValueError: If the file is outside the logs directory or doesn't exist.
+        """
+        logger.info("MCP Resource Read: logs://%s", filename)
+
+        log_path = self._resolve_log_path(filename)
+        if log_path is None:
+            logger.warning(
+                "MCP Resource logs://%s security check FAILED: Path traversal attempt", filename
+            )
+            raise ValueError("Invalid log file path")
+        if not log_path.is_file():
+            logger.warning("MCP Resource logs://%s FAILED: Log file not found", filename)
+            raise ValueError(f"Log file not found: {filename}")
+
+        # Only read the end of large logs, in a worker thread to keep the event
+        # loop free for other requests
+        offset = max(0, log_path.stat().st_size - MAX_LOG_RESOURCE_BYTES)
+        content, start, end, size, _ = await asyncio.to_thread(
+            _read_log, log_path, offset, MAX_LOG_RESOURCE_BYTES, None
+        )
+        logger.info(
+            "MCP Resource logs://%s SUCCESS: Read bytes %d-%d of %d", filename, start, end, size
+        )
+        if start > 0:
+            return (
+                f"[... first {start} bytes omitted, use read_process_log to read them ...]\n"
+                + content
+            )
+        return content
+
+
+def register_process_services(mcp: FastMCP, process_manager: ProcessManager) -> None:
+    """Register process management MCP services.
+
+    Args:
+        mcp: MCP server instance.
+        process_manager: Process manager instance.
+    """
+    logger.info("Registering process management MCP services")
+    ProcessServices(process_manager).register(mcp)
@@ -6,6 +6,7 @@ import pytest
 import tempfile
 
 from simply_maestro.core import FileManager
+from simply_maestro.core.file_manager import MAX_CHUNK_SIZE
 
 
 @pytest.fixture
@@ -40,6 +41,44 @@ def test_read_file(file_manager, test_file):
     assert not success, "Should fail for non-existent file"
 
 
+def test_read_file_chunk(file_manager, test_dir):
+    """Test reading a file in chunks."""
+    test_file = test_dir / "unicode.txt"
+    content = "añb€c😀d" * 100
+    test_file.write_text(content, encoding="utf-8")
+
+    chunks = []
+    offset = 0
+    while True:
+        success, chunk = file_manager.read_file_chunk(test_file, offset, size=7)
+        assert success, f"Failed to read chunk: {chunk}"
+        assert chunk["size"] == len(content.encode("utf-8"))
+        chunks.append(chunk["content"])
+        offset = chunk["next_offset"]
+        if chunk["eof"]:
+            break
+    assert "".join(chunks) == content, "Chunks should not split characters"
+
+    success, chunk = file_manager.read_file_chunk(test_file, offset=-1)
+    assert not success, "Should fail for a negative offset"
+
+    # Invalid bytes are replaced, while a character split at the end is kept
+    # for the next chunk
+    binary_file = test_dir / "binary.txt"
+    binary_file.write_bytes(b"ab\xffcd\xe2\x82\xac")
+    success, chunk = file_manager.read_file_chunk(binary_file, size=6)
+    assert success, f"Failed to read chunk: {chunk}"
+    assert chunk["content"] == "ab\ufffdcd" and chunk["next_offset"] == 5
+    success, chunk = file_manager.read_file_chunk(binary_file, offset=5)
+    assert chunk["content"] == "\u20ac" and chunk["eof"]
+
+    big_file = test_dir / "big.txt"
+    big_file.write_text("x" * (MAX_CHUNK_SIZE + 10))
+    success, chunk = file_manager.read_file_chunk(big_file, size=10**10)
+    assert success, f"Failed to read chunk: {chunk}"
+    assert chunk["next_offset"] == MAX_CHUNK_SIZE and not chunk["eof"], "Chunk size should be capped"
+
+
 def test_write_file(file_manager, test_dir):
     """Test writing to a file."""
     test_file = test_dir / "new_file.txt"
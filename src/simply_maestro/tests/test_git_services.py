@@ -0,0 +1,251 @@
+"""Tests for the GitServices class."""
+
+import asyncio
+import subprocess
+from pathlib import Path
+import pytest
+import tempfile
+from unittest.mock import patch
+
+from simply_maestro.core import FileManager, VersionControlManager
+from simply_maestro.mcp.services import FileServices, GitServices
+from simply_maestro.mcp.services import git_services
+from simply_maestro.mcp.services.git_services import _describe_status
+
+
+@pytest.fixture
+def repo_dir():
+    """Create a Git repository with a single commit."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        repo = Path(temp_dir)
+
+        def git(*args):
+            subprocess.run(["git", *args], cwd=repo, check=True, capture_output=True)
+
+        git("init")
+        git("config", "user.email", "test@example.com")
+        git("config", "user.name", "Test User")
+        (repo / "tracked.txt").write_text("Initial content\n")
+        git("add", "tracked.txt")
+        git("commit", "-m", "Initial commit")
+        yield repo
+
+
+@pytest.fixture
+def services(repo_dir):
+    """Create a GitServices instance for testing."""
+    manager = VersionControlManager(repo_path=repo_dir, status_cache_ttl=0, watch=False)
+    return GitServices(manager)
+
+
+def test_describe_status_branch():
+    """Test describing how the branch compares to its upstream."""
+    assert _describe_status("main...origin/main [ahead 2]", []) == (
+        "On branch main\n"
+        "Your branch is ahead of 'origin/main' by 2 commit(s).\n"
+        "\n"
+        "nothing to commit, working tree clean"
+    )
+    assert "is behind 'origin/main' by 3 commit(s)." in _describe_status(
+        "main...origin/main [behind 3]", []
+    )
+    assert "Your branch and 'origin/main' have diverged." in _describe_status(
+        "main...origin/main [ahead 1, behind 1]", []
+    )
+    assert "Your branch is based on 'origin/main', but the upstream is gone." in _describe_status(
+        "main...origin/main [gone]", []
+    )
+    assert _describe_status("HEAD (no branch)", [], "1234567") == (
+        "HEAD detached at 1234567\nnothing to commit, working tree clean"
+    )
+
+
+def test_describe_status_files():
+    """Test the sections and labels of changed files."""
+    status = _describe_status("main", ["M  staged.txt", " D deleted.txt", "?? new.txt"])
+    assert status == (
+        "On branch main\n"
+        "Changes to be committed:\n"
+        "\tmodified:   staged.txt\n"
+        "\n"
+        "Changes not staged for commit:\n"
+        "\tdeleted:    deleted.txt\n"
+        "\n"
+        "Untracked files:\n"
+        "\tnew.txt"
+    )
+
+    status = _describe_status("main", ["UU both.txt", "UD theirs.txt", "MM other.txt"])
+    assert status == (
+        "On branch main\n"
+        "Changes to be committed:\n"
+        "\tmodified:   other.txt\n"
+        "\n"
+        "Unmerged paths:\n"
+        "\tboth modified:   both.txt\n"
+        "\tdeleted by them: theirs.txt\n"
+        "\n"
+        "Changes not staged for commit:\n"
+        "\tmodified:   other.txt"
+    )
+
+
+@pytest.mark.asyncio
+async def test_git_status_detached(services, repo_dir):
+    """Test that a detached HEAD is described with the commit it points to."""
+    subprocess.run(["git", "checkout", "--detach"], cwd=repo_dir, check=True, capture_output=True)
+    head = subprocess.run(
+        ["git", "rev-parse", "--short=7", "HEAD"], cwd=repo_dir, check=True, capture_output=True, text=True
+    ).stdout.strip()
+
+    try:
+        result = await services.git_status()
+        assert result["success"], result
+        assert result["status"].startswith(f"HEAD detached at {head}\n")
+    finally:
+        await services._version_control_manager.aclose()
+
+
+@pytest.mark.asyncio
+async def test_repo_snapshot(services, repo_dir):
+    """Test that the snapshot lists the same files as git_status."""
+    (repo_dir / "tracked.txt").write_text("Changed content\n")
+    (repo_dir / "new.txt").write_text("New file\n")
+
+    try:
+        snapshot = await services.repo_snapshot()
+        assert snapshot["success"], snapshot
+        assert snapshot["files"] == [" M tracked.txt", "?? new.txt"]
+        assert snapshot["files"] == (await services.git_status())["files"]
+        assert len(snapshot["entries"]) == 1 and "Initial commit" in snapshot["entries"][0]
+        assert "+Changed content" in snapshot["diff"]
+    finally:
+        await services._version_control_manager.aclose()
+
+
+@pytest.mark.asyncio
+async def test_git_log_progress_and_limit(services, repo_dir):
+    """Test that log progress counts commits and the size limit counts bytes."""
+    for i in range(3):
+        subprocess.run(
+            ["git", "commit", "--allow-empty", "-m", f"Commit {i} \u00e9\u00e9\u00e9"],
+            cwd=repo_dir, check=True, capture_output=True,
+        )
+
+    class Ctx:
+        """Context that records the progress reported to it."""
+
+        def __init__(self):
+            self.reports = []
+
+        async def report_progress(self, progress, total, message=None):
+            self.reports.append((progress, total))
+
+    try:
+        ctx = Ctx()
+        with patch.object(git_services, "_LOG_PROGRESS_INTERVAL", 1):
+            result = await services.git_log(count=4, format="medium", ctx=ctx)
+        assert result["success"], result
+        assert ctx.reports == [(1, 4), (2, 4), (3, 4), (4, 4)]
+
+        oneline = await services.git_log(count=4)
+        size = sum(len(entry.encode("utf-8")) + 1 for entry in oneline["entries"])
+        with patch.object(git_services, "DEFAULT_MAX_OUTPUT_BYTES", size - 1):
+            # With all branches, so the cached result isn't reused
+            result = await services.git_log(count=4, all_branches=True)
+        assert result["truncated"], "The limit is in bytes, not characters"
+        assert result["entries"] == oneline["entries"][:-1]
+    finally:
+        await services._version_control_manager.aclose()
+
+
+def slow_spy(method, calls):
+    """Wrap a coroutine method so it counts its calls and takes a while."""
+    async def spy(*args, **kwargs):
+        calls.append(args)
+        await asyncio.sleep(0.1)
+        return await method(*args, **kwargs)
+
+    return spy
+
+
+@pytest.mark.asyncio
+async def test_concurrent_reads_share_work(services, repo_dir):
+    """Test that identical concurrent calls share a single run."""
+    manager = services._version_control_manager
+    (repo_dir / "new.txt").write_text("New file\n")
+
+    calls = []
+    with patch.object(manager, "get_combined_status", slow_spy(manager.get_combined_status, calls)):
+        first, second = await asyncio.gather(services.git_status(), services.git_status())
+    assert len(calls) == 1, "Identical calls should share one status"
+    assert first == second
+    assert first["files"] == ["?? new.txt"]
+
+    # Cancelling one caller doesn't cancel the work the other is waiting for
+    calls.clear()
+    with patch.object(manager, "get_combined_status", slow_spy(manager.get_combined_status, calls)):
+        cancelled = asyncio.ensure_future(services.git_status())
+        waiting = asyncio.ensure_future(services.git_status())
+        await asyncio.sleep(0.01)
+        cancelled.cancel()
+        result = await waiting
+    assert len(calls) == 1
+    assert result["success"], result
+
+
+@pytest.mark.asyncio
+async def test_reads_after_writes_dont_join(services, repo_dir):
+    """Test that reads made after a write don't join reads started before it."""
+    manager = services._version_control_manager
+    try:
+        calls = []
+        with patch.object(manager, "get_combined_status", slow_spy(manager.get_combined_status, calls)):
+            before = asyncio.ensure_future(services.git_status())
+            await asyncio.sleep(0.01)
+            result = await services.git_create_tag("v1", annotated=False)
+            assert result["success"], result
+            after = await services.git_status()
+            await before
+        assert len(calls) == 2, "A read after a write should run again"
+
+        # Files written by the file tools are seen right away too
+        files = FileServices(FileManager([repo_dir]), manager)
+        calls.clear()
+        with patch.object(manager, "get_combined_status", slow_spy(manager.get_combined_status, calls)):
+            before = asyncio.ensure_future(services.git_status())
+            await asyncio.sleep(0.01)
+            await files.write_file(str(repo_dir / "tracked.txt"), "Changed content\n")
+            after = await services.git_status()
+            await before
+        assert len(calls) == 2
+        assert " M tracked.txt" in after["files"]
+    finally:
+        await services._version_control_manager.aclose()
+
+
+@pytest.mark.asyncio
+async def test_ref_results_cached_until_commit(services, repo_dir):
+    """Test that log and branch results are reused until the refs change."""
+    manager = services._version_control_manager
+    try:
+        log = await services.git_log()
+        branches = await services.git_branch()
+        assert log["count"] == 1 and branches["success"]
+
+        with patch.object(manager, "iter_log", side_effect=AssertionError), \
+                patch.object(manager, "get_branch_list", side_effect=AssertionError):
+            assert await services.git_log() is log, "Log should be served from the cache"
+            assert await services.git_branch() is branches, "Branches should be served from the cache"
+
+        (repo_dir / "tracked.txt").write_text("Changed content\n")
+        result = await services.git_commit("Second commit")
+        assert not result.startswith("Error"), result
+
+        log = await services.git_log()
+        assert log["count"] == 2 and "Second commit" in log["entries"][0]
+        subprocess.run(["git", "branch", "other"], cwd=repo_dir, check=True)
+        branches = await services.git_branch()
+        assert "other" in branches["branches"]
+    finally:
+        await services._version_control_manager.aclose()
@@ -2,6 +2,7 @@
 
 import asyncio
 import os
+import sys
 from pathlib import Path
 import pytest
 import tempfile
@@ -21,8 +22,8 @@ def test_dir():
 @pytest.fixture
 def process_config(test_dir):
     """Create a test process configuration."""
-    # Command that echoes a message and sleeps
-    cmd = "python -c \"import time; print('Test process started'); time.sleep(10)\""
+    # Command that echoes a message and sleeps, run without a shell
+    cmd = [sys.executable, "-c", "import time; print('Test process started'); time.sleep(10)"]
     return ProcessConfig(
         command=cmd,
         working_dir=test_dir,
@@ -74,3 +75,58 @@ async def test_process_restart(process_config):
     
     # Stop process
     await manager.stop()
+
+
+@pytest.mark.asyncio
+async def test_process_output_callback(test_dir):
+    """Test that process output is delivered line by line to the callback."""
+    config = ProcessConfig(
+        command=[
+            sys.executable,
+            "-c",
+            "import sys; sys.stdout.write('first\\nsecond\\nthird'); sys.stdout.flush()",
+        ],
+        working_dir=test_dir,
+        capture_output=True,
+    )
+    manager = ProcessManager(config)
+    
+    lines = []
+    manager.set_output_callback(lines.append)
+    
+    success, message = await manager.start()
+    assert success, f"Failed to start process: {message}"
+    
+    # Wait for the process to exit and its output to be drained
+    for _ in range(50):
+        if manager._process is None:
+            break
+        await asyncio.sleep(0.1)
+    
+    assert lines == ["first", "second", "third"], "Unterminated last line should be delivered"
+    assert not manager.is_running, "Process should not be running after it exits"
+
+
+@pytest.mark.asyncio
+@pytest.mark.skipif(os.name != "posix", reason="Quoted arguments are only kept together on POSIX")
+async def test_process_string_command(test_dir):
+    """Test that quoted arguments in a string command are kept together."""
+    config = ProcessConfig(
+        command=f"\"{sys.executable}\" -c \"print('hello world')\"",
+        working_dir=test_dir,
+        capture_output=True,
+    )
+    manager = ProcessManager(config)
+    
+    lines = []
+    manager.set_output_callback(lines.append)
+    
+    success, message = await manager.start()
+    assert success, f"Failed to start process: {message}"
+    
+    for _ in range(50):
+        if manager._process is None:
+            break
+        await asyncio.sleep(0.1)
+    
+    assert lines == ["hello world"]
@@ -0,0 +1,146 @@
+"""Tests for the ProcessServices class."""
+
+import os
+from pathlib import Path
+import pytest
+import tempfile
+from unittest.mock import patch
+
+from simply_maestro.core import ProcessManager
+from simply_maestro.core.process_manager import ProcessConfig
+from simply_maestro.mcp.services import ProcessServices
+from simply_maestro.mcp.services import process_services
+
+
+@pytest.fixture
+def test_dir(monkeypatch):
+    """Create a temporary directory with a logs directory, and change into it."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        test_dir = Path(temp_dir).resolve()
+        (test_dir / "logs").mkdir()
+        # Log files are looked up relative to the working directory
+        monkeypatch.chdir(test_dir)
+        yield test_dir
+
+
+@pytest.fixture
+def services(test_dir):
+    """Create a ProcessServices instance for testing."""
+    manager = ProcessManager(ProcessConfig(command="", working_dir=test_dir))
+    return ProcessServices(manager)
+
+
+@pytest.mark.asyncio
+async def test_log_paths_outside_logs_dir(services, test_dir):
+    """Test that log files can only be read from inside the logs directory."""
+    secret = test_dir / "secret.log"
+    secret.write_text("Secret\n")
+    (test_dir / "logs" / "app.log").write_text("Log line\n")
+    try:
+        (test_dir / "logs" / "escape.log").symlink_to(secret)
+    except OSError:
+        pytest.skip("Symlinks are not supported")
+
+    result = await services.read_process_log("app.log")
+    assert result["success"], result
+    assert result["content"] == "Log line\n"
+
+    for filename in ("../secret.log", "escape.log", str(secret)):
+        result = await services.read_process_log(filename)
+        assert not result["success"], f"{filename} should be rejected"
+        assert result["message"] == "Invalid log file path"
+        with pytest.raises(ValueError, match="Invalid log file path"):
+            await services.read_log_resource(filename)
+
+
+@pytest.mark.asyncio
+async def test_read_log_tail(services, test_dir):
+    """Test reading the last lines of a log, with and without a final newline."""
+    lines = [f"line {i:05d}" for i in range(10000)]
+    log_file = test_dir / "logs" / "app.log"
+    log_file.write_text("\n".join(lines) + "\n")
+    size = log_file.stat().st_size
+    assert size > process_services._TAIL_BLOCK_SIZE
+
+    # The last 64 KiB block holds fewer lines than requested
+    result = await services.read_process_log("app.log", tail_lines=6000)
+    assert result["success"], result
+    assert result["content"] == "\n".join(lines[-6000:]) + "\n"
+    assert result["next_offset"] == size and not result["truncated"]
+
+    result = await services.read_process_log("app.log", tail_lines=2)
+    assert result["content"] == "line 09998\nline 09999\n"
+    result = await services.read_process_log("app.log", tail_lines=20000)
+    assert result["offset"] == 0 and result["content"].count("\n") == 10000
+    result = await services.read_process_log("app.log", tail_lines=0)
+    assert result["content"] == ""
+
+    log_file.write_text("first\nsecond\nthird")
+    result = await services.read_process_log("app.log", tail_lines=2)
+    assert result["content"] == "second\nthird"
+
+    # Lines that don't fit are cut off at their start
+    result = await services.read_process_log("app.log", tail_lines=2, max_bytes=8)
+    assert result["content"] == "nd\nthird"
+    assert result["truncated"]
+
+
+@pytest.mark.asyncio
+async def test_read_log_window(services, test_dir):
+    """Test paging through a log with offsets."""
+    (test_dir / "logs" / "app.log").write_text("0123456789")
+
+    result = await services.read_process_log("app.log", offset=2, max_bytes=5)
+    assert result["success"], result
+    assert result["content"] == "23456"
+    assert (result["offset"], result["next_offset"], result["size"]) == (2, 7, 10)
+    assert result["truncated"], "More of the log follows"
+
+    result = await services.read_process_log("app.log", offset=result["next_offset"], max_bytes=5)
+    assert result["content"] == "789"
+    assert result["next_offset"] == 10 and not result["truncated"]
+
+    result = await services.read_process_log("app.log", offset=100)
+    assert result["success"], result
+    assert result["content"] == ""
+    assert result["offset"] == result["next_offset"] == 10 and not result["truncated"]
+
+    result = await services.read_process_log("app.log", offset=-1)
+    assert not result["success"]
+
+
+@pytest.mark.asyncio
+async def test_log_resource(services, test_dir):
+    """Test that the log resource keeps the end of large logs, with a notice."""
+    (test_dir / "logs" / "app.log").write_text("0123456789")
+
+    assert await services.read_log_resource("app.log") == "0123456789"
+    with patch.object(process_services, "MAX_LOG_RESOURCE_BYTES", 4):
+        content = await services.read_log_resource("app.log")
+    assert content == (
+        "[... first 6 bytes omitted, use read_process_log to read them ...]\n6789"
+    )
+
+
+@pytest.mark.asyncio
+async def test_list_process_logs(services, test_dir):
+    """Test that the reused log listing picks up new files."""
+    logs_dir = test_dir / "logs"
+    (logs_dir / "first.log").write_text("First\n")
+    (logs_dir / "notes.txt").write_text("Not a log\n")
+
+    result = await services.list_process_logs()
+    assert result["success"], result
+    assert [log["filename"] for log in result["logs"]] == ["first.log"]
+
+    (logs_dir / "second.log").write_text("Second\n")
+    # Don't depend on the file system's timestamp resolution
+    os.utime(logs_dir, ns=(0, logs_dir.stat().st_mtime_ns + 1))
+    result = await services.list_process_logs()
+    assert sorted(log["filename"] for log in result["logs"]) == ["first.log", "second.log"]
+
+    # Sizes are read again even when the listing is reused
+    (logs_dir / "first.log").write_text("First, longer\n")
+    result = await services.list_process_logs()
+    sizes = {log["filename"]: log["size"] for log in result["logs"]}
+    assert sizes["first.log"] == len("First, longer\n")
@@ -0,0 +1,415 @@
+"""Tests for the VersionControlManager class."""
+
+import asyncio
+import os
+import subprocess
+import sys
+from contextlib import aclosing
+from pathlib import Path
+import pytest
+import tempfile
+from unittest.mock import patch
+
+from simply_maestro.core import VersionControlManager
+
+
+@pytest.fixture
+def test_dir():
+    """Create a temporary directory for testing."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        yield Path(temp_dir)
+
+
+@pytest.fixture
+def repo_dir(test_dir):
+    """Create a Git repository with a single commit."""
+    def git(*args):
+        subprocess.run(["git", *args], cwd=test_dir, check=True, capture_output=True)
+
+    git("init")
+    git("config", "user.email", "test@example.com")
+    git("config", "user.name", "Test User")
+    (test_dir / "tracked.txt").write_text("Initial content\n")
+    git("add", "tracked.txt")
+    git("commit", "-m", "Initial commit")
+    return test_dir
+
+
+@pytest.fixture
+def vcm(repo_dir):
+    """Create a VersionControlManager instance for testing."""
+    # Disable status caching so tests see changes made behind its back
+    return VersionControlManager(repo_path=repo_dir, status_cache_ttl=0, watch=False)
+
+
+@pytest.mark.asyncio
+async def test_not_a_repo(test_dir):
+    """Test that operations fail outside a Git repository."""
+    manager = VersionControlManager(repo_path=test_dir)
+
+    assert not await manager.is_git_repo(), "Plain directory should not be a Git repository"
+    success, message = await manager.get_status()
+    assert not success, "Status should fail outside a Git repository"
+    assert "Not a Git repository" in message
+    with pytest.raises(RuntimeError, match="Not a Git repository"):
+        async for _ in manager.iter_log():
+            pass
+
+
+@pytest.mark.asyncio
+async def test_status_and_commit(vcm, repo_dir):
+    """Test reading the status and committing changes."""
+    success, status = await vcm.get_status()
+    assert success, f"Failed to get status: {status}"
+    assert status == "", "Fresh repository should have no changes"
+
+    (repo_dir / "tracked.txt").write_text("Modified content\n")
+    (repo_dir / "new.txt").write_text("New file\n")
+
+    success, status = await vcm.get_status()
+    assert success, f"Failed to get status: {status}"
+    assert "tracked.txt" in status and "new.txt" in status
+
+    success, message = await vcm.commit("Second commit")
+    assert success, f"Failed to commit: {message}"
+
+    success, status = await vcm.get_status()
+    assert success, f"Failed to get status: {status}"
+    assert status == "", "All changes, including new files, should be committed"
+
+
+@pytest.mark.asyncio
+async def test_commit_files(vcm, repo_dir):
+    """Test committing only the given files."""
+    (repo_dir / "tracked.txt").write_text("Modified content\n")
+    (repo_dir / "staged.txt").write_text("Staged file\n")
+    subprocess.run(["git", "add", "staged.txt"], cwd=repo_dir, check=True)
+    (repo_dir / "new.txt").write_text("New file\n")
+    (repo_dir / "other.txt").write_text("Other file\n")
+
+    success, message = await vcm.commit("Add new file", ["new.txt"])
+    assert success, f"Failed to commit: {message}"
+
+    committed = subprocess.run(
+        ["git", "show", "--name-only", "--format=", "HEAD"],
+        cwd=repo_dir, check=True, capture_output=True, text=True,
+    ).stdout.split()
+    assert committed == ["new.txt"], "Only the given files should be committed"
+    success, status = await vcm.get_status()
+    assert status.splitlines() == ["A  staged.txt", " M tracked.txt", "?? other.txt"]
+
+
+@pytest.mark.asyncio
+async def test_combined_status(vcm, repo_dir):
+    """Test reading the status and branch with a single command."""
+    (repo_dir / "new.txt").write_text("New file\n")
+
+    success, status = await vcm.get_combined_status()
+    assert success, f"Failed to get status: {status}"
+    header, _, files = status.partition("\n")
+    assert header.startswith("## "), "Status should start with the branch header"
+    assert files == "?? new.txt"
+
+
+@pytest.mark.asyncio
+async def test_log(vcm):
+    """Test reading the commit history."""
+    success, log = await vcm.get_log(count=5)
+    assert success, f"Failed to get log: {log}"
+    assert "Initial commit" in log
+    assert len(log.splitlines()) == 1, "Repository has a single commit"
+
+
+@pytest.mark.asyncio
+async def test_iter_log(vcm, repo_dir):
+    """Test iterating over the commit history."""
+    lines = [line async for line in vcm.iter_log(count=5)]
+    assert len(lines) == 1 and "Initial commit" in lines[0]
+
+    # Stopping early stops git, and no slot is held while the caller is busy
+    for i in range(3):
+        (repo_dir / "tracked.txt").write_text(f"Change {i}\n")
+        success, message = await vcm.commit(f"Commit {i}")
+        assert success, f"Failed to commit: {message}"
+    vcm._git_slots = asyncio.Semaphore(1)
+    async with aclosing(vcm.iter_log(count=5)) as lines:
+        async for line in lines:
+            assert "Commit 2" in line
+            assert not vcm._git_slots.locked(), "Slots should be free between lines"
+            break
+    assert not vcm._git_slots.locked()
+
+
+@pytest.mark.asyncio
+async def test_refs_state(vcm, repo_dir):
+    """Test that the refs state changes exactly when HEAD or a ref changes."""
+    try:
+        state = await vcm.get_refs_state()
+        assert state is not None, "Refs state should be available in a repository"
+        assert await vcm.get_refs_state() == state, "Refs state should be stable"
+
+        (repo_dir / "tracked.txt").write_text("Modified content\n")
+        assert await vcm.get_refs_state() == state, "Work tree changes don't affect refs"
+
+        success, message = await vcm.commit("Second commit")
+        assert success, f"Failed to commit: {message}"
+        committed_state = await vcm.get_refs_state()
+        assert committed_state != state, "Committing should change the refs state"
+
+        subprocess.run(["git", "branch", "other"], cwd=repo_dir, check=True)
+        assert await vcm.get_refs_state() != committed_state, "New branches should change the refs state"
+    finally:
+        await vcm.aclose()
+
+
+@pytest.mark.asyncio
+async def test_diff_truncation(vcm, repo_dir):
+    """Test that large diffs are truncated to the requested size."""
+    (repo_dir / "tracked.txt").write_text("Changed line\n" * 10000)
+
+    success, diff = await vcm.get_diff()
+    assert success, f"Failed to get diff: {diff}"
+    assert "truncated" not in diff, "Diff should fit in the default limit"
+
+    success, diff = await vcm.get_diff(max_bytes=1000)
+    assert success, f"Failed to get diff: {diff}"
+    assert diff.endswith("[output truncated at 1000 bytes]")
+    assert len(diff) < 1100
+
+    received = []
+
+    async def progress(count):
+        received.append(count)
+
+    success, preview, truncated = await vcm.get_diff_preview(max_bytes=1000, progress=progress)
+    assert success, f"Failed to get diff: {preview}"
+    assert truncated, "Diff should not fit in the preview"
+    assert len(preview) <= 1000 and preview.endswith("Changed line\n")
+    assert received and received[-1] == 1000, "Progress should be reported up to the limit"
+
+    # A slow client holds up neither git nor its slot, nor eats into its timeout
+    (repo_dir / "tracked.txt").write_text("Changed line\n" * 50000)
+    vcm._git_timeout = 0.2
+    vcm._git_slots = asyncio.Semaphore(1)
+    received.clear()
+
+    async def slow_progress(count):
+        await asyncio.sleep(0.3)
+        received.append((count, vcm._git_slots.locked()))
+
+    success, preview, truncated = await vcm.get_diff_preview(
+        max_bytes=256 * 1024, progress=slow_progress
+    )
+    assert success, f"Slow progress reports should not time out git: {preview}"
+    assert received[-1] == (256 * 1024, False)
+
+
+@pytest.mark.asyncio
+async def test_git_timeout(vcm, repo_dir):
+    """Test that Git commands that take too long are stopped."""
+    assert await vcm.is_git_repo()
+    vcm._git_timeout = 0.2
+
+    async def hang(*args):
+        await asyncio.sleep(10)
+
+    with patch.object(vcm, "_read_git_output", side_effect=hang):
+        success, message = await vcm.get_log()
+        assert not success, "Log should fail once the timeout has passed"
+        assert "timed out" in message
+
+        # Output git wrote before it was stopped doesn't keep it from being reaped
+        (repo_dir / "tracked.txt").write_text("Changed line\n" * 50000)
+        success, message = await asyncio.wait_for(vcm.get_diff(), 5)
+        assert "timed out" in message
+
+    async def stall():
+        await asyncio.sleep(10)
+
+    # iter_log stops when Git produces no output for too long
+    real_exec = asyncio.create_subprocess_exec
+
+    async def exec_stalled(*args, **kwargs):
+        process = await real_exec(*args, **kwargs)
+        process.stdout.readline = stall
+        return process
+
+    with patch("asyncio.create_subprocess_exec", side_effect=exec_stalled):
+        with pytest.raises(RuntimeError, match="timed out"):
+            async for _ in vcm.iter_log():
+                pass
+
+    success, log = await vcm.get_log()
+    assert success, f"Failed to get log: {log}"
+
+
+@pytest.mark.asyncio
+async def test_git_cancelled(vcm):
+    """Test that Git is stopped and reaped when the caller is cancelled."""
+    assert await vcm.is_git_repo()
+    started = []
+    real_exec = asyncio.create_subprocess_exec
+
+    async def exec_slow(*args, **kwargs):
+        # Stands in for a git that takes its time
+        process = await real_exec(sys.executable, "-c", "import time; time.sleep(10)", **kwargs)
+        started.append(process)
+        return process
+
+    with patch("asyncio.create_subprocess_exec", side_effect=exec_slow):
+        task = asyncio.ensure_future(vcm.commit("Cancelled commit"))
+        while not started:
+            await asyncio.sleep(0.01)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+    assert started[0].returncode is not None, "Git should have been reaped"
+
+
+@pytest.mark.asyncio
+@pytest.mark.skipif(os.name != "posix", reason="Hook is a shell script")
+async def test_slow_hook_not_timed_out(vcm, repo_dir):
+    """Test that commands that change the repository are given all the time they need."""
+    hook = repo_dir / ".git" / "hooks" / "pre-commit"
+    hook.write_text("#!/bin/sh\nsleep 1\n")
+    hook.chmod(0o755)
+    vcm._git_timeout = 0.2
+
+    (repo_dir / "tracked.txt").write_text("Modified content\n")
+    success, message = await vcm.commit("Slow commit")
+    assert success, f"Commit should wait for its hook: {message}"
+
+
+@pytest.mark.asyncio
+async def test_status_cache(repo_dir):
+    """Test that status results are cached until the repository changes."""
+    manager = VersionControlManager(repo_path=repo_dir, status_cache_ttl=60, watch=False)
+
+    success, status = await manager.get_status()
+    assert success, f"Failed to get status: {status}"
+    assert status == ""
+
+    # A change made outside the manager is not seen while the result is fresh
+    (repo_dir / "new.txt").write_text("New file\n")
+    success, status = await manager.get_status()
+    assert status == "", "Status should be served from the cache"
+
+    # Changes made elsewhere are seen once the cache is invalidated
+    manager.invalidate_status_cache()
+    success, status = await manager.get_status()
+    assert status == "?? new.txt"
+
+    # Changes made through the manager invalidate the cache
+    success, message = await manager.stage_files(["new.txt"])
+    assert success, f"Failed to stage files: {message}"
+    success, status = await manager.get_status()
+    assert status == "A  new.txt"
+
+
+@pytest.mark.asyncio
+async def test_status_cache_watch(repo_dir):
+    """Test that watched status results are reused until a file changes."""
+    pytest.importorskip("watchdog")
+    manager = VersionControlManager(repo_path=repo_dir, status_cache_ttl=0)
+    try:
+        assert manager._observer is not None, "Repository should be watched"
+
+        success, status = await manager.get_status()
+        assert success, f"Failed to get status: {status}"
+        assert status == ""
+
+        # Nothing changed, so no git process should be needed
+        with patch.object(manager, "_run_repo_command", side_effect=AssertionError):
+            success, status = await manager.get_status()
+        assert status == "", "Status should be served from the cache"
+
+        # A change made outside the manager is picked up once it is seen
+        (repo_dir / "new.txt").write_text("New file\n")
+        for _ in range(50):
+            success, status = await manager.get_status()
+            if status:
+                break
+            await asyncio.sleep(0.1)
+        assert status == "?? new.txt"
+
+        # Results are only trusted for a bounded time, even without an event
+        with patch("simply_maestro.core.version_control.WATCHED_STATUS_CACHE_TTL", 0):
+            (repo_dir / "other.txt").write_text("Other file\n")
+            success, status = await manager.get_status()
+        assert "?? other.txt" in status
+    finally:
+        manager.close()
+
+
+@pytest.mark.asyncio
+async def test_libgit2_status(vcm, repo_dir):
+    """Test that the in-process status matches the output of Git."""
+    pytest.importorskip("pygit2")
+    assert vcm._libgit2_repo is not None, "Repository should be opened with libgit2"
+
+    def git(*args):
+        subprocess.run(["git", *args], cwd=repo_dir, check=True, capture_output=True)
+
+    (repo_dir / "tracked.txt").write_text("Modified content\n")
+    (repo_dir / "staged.txt").write_text("Staged file\n")
+    git("add", "staged.txt")
+    (repo_dir / "staged.txt").write_text("Changed after staging\n")
+    (repo_dir / "untracked").mkdir()
+    (repo_dir / "untracked" / "file.txt").write_text("Untracked file\n")
+
+    def git_status():
+        return subprocess.run(
+            ["git", "status", "--porcelain"], cwd=repo_dir, capture_output=True, text=True
+        ).stdout.strip("\n")
+
+    success, status = await vcm.get_status()
+    assert success, f"Failed to get status: {status}"
+    assert status == git_status()
+
+    # Renames are left to Git, which detects them
+    git("mv", "tracked.txt", "renamed.txt")
+    with patch.object(vcm, "_format_libgit2_status", wraps=vcm._format_libgit2_status) as fmt:
+        success, status = await vcm.get_status()
+    assert fmt.called
+    assert "RM tracked.txt -> renamed.txt" in status
+
+    # So are files removed from the index but kept, and intent-to-add files
+    git("reset", "-q", "--hard")
+    git("rm", "-q", "--cached", "tracked.txt")
+    (repo_dir / "intent.txt").write_text("Intent to add\n")
+    git("add", "-N", "intent.txt")
+    success, status = await vcm.get_status()
+    assert success, f"Failed to get status: {status}"
+    assert status == git_status()
+    assert "D  tracked.txt" in status and "?? tracked.txt" in status
+    assert "A intent.txt" in status and "AM intent.txt" not in status
+
+
+@pytest.mark.asyncio
+async def test_resolve_ref(vcm):
+    """Test looking up revision names with the long-lived helper."""
+    try:
+        resolved = await vcm.resolve_ref("HEAD")
+        assert resolved is not None, "HEAD should resolve"
+        object_id, object_type = resolved
+        assert object_type == "commit"
+        assert await vcm.resolve_ref(object_id[:7]) == resolved
+
+        helper = vcm._batch_check
+        assert await vcm.resolve_ref("no-such-branch") is None
+        assert await vcm.resolve_ref("HEAD\nHEAD") is None
+        assert vcm._batch_check is helper, "Helper should be reused between lookups"
+
+        success, message = await vcm.get_show("no-such-branch")
+        assert not success
+        assert "unknown revision" in message
+        success, details = await vcm.get_show("HEAD")
+        assert success, f"Failed to show commit: {details}"
+        assert "Initial commit" in details
+        success, details = await vcm.get_show("HEAD^!")
+        assert success, f"Revision notations should be passed to git show: {details}"
+        assert "Initial commit" in details
+        success, message = await vcm.get_show("--output=file")
+        assert not success, "Options should not be passed to git show"
+    finally:
+        await vcm.aclose()